@@ -52,6 +52,13 @@ class Rule:
             variables |= left.variables | right.variables
         return frozenset(variables)
 
+    @functools.cached_property
+    def variables_mask(self) -> int:
+        mask = 0
+        for variable in self.variables:
+            mask |= variable.mask
+        return mask
+
 
 @d.dataclass(frozen=True)
 class Instance:
@@ -59,12 +66,20 @@ class Instance:
     substitution: terms.Substitution
 
     def __post_init__(self) -> None:
-        assert self.rule.variables == self.substitution.keys()
+        # Comparing the sizes and masks is a cheap necessary condition for
+        # the substitution to be defined on exactly the rule's variables.
+        assert len(self.substitution) == len(self.rule.variables)
+        assert terms.get_substitution_mask(self.substitution) == self.rule.variables_mask
 
     def _instantiate(
         self, term: terms.Term, *, evaluate: bool = True
     ) -> terms.Term:
-        result = term.substitute(self.substitution)
+        # The substitution is defined on exactly the rule's variables, hence,
+        # the rule's mask is the mask of the substitution.
+        mask = self.rule.variables_mask
+        result = term
+        if term.variables_mask & mask:
+            result = term.substitute_memoized(self.substitution, mask, {})
         if evaluate:
             assert result.evaluated is not None
             result = result.evaluated
@@ -90,6 +105,8 @@ class Instance:
 
 @d.dataclass(frozen=True)
 class Tree:
+    __slots__ = ("instance", "premises")
+
     instance: Instance
     premises: t.Tuple[Tree, ...]
 
@@ -99,6 +116,8 @@ Question = terms.Term
 
 @d.dataclass(frozen=True)
 class Answer:
+    __slots__ = ("substitution", "tree")
+
     substitution: terms.Substitution
     tree: Tree
 
@@ -124,13 +143,20 @@ class System:
         self, question: Question, *, depth_first: bool = False
     ) -> t.Iterator[Answer]:
         variables = question.variables
-        queue = collections.deque([_Node.create_root(self, question)])
-        while queue:
-            head = queue.popleft()
-            if depth_first:
-                queue.extendleft(head.expand())
-            else:
-                queue.extend(head.expand())
+        root = _Node.create_root(self, question)
+        frontier: t.Union[t.List[_Node], t.Deque[_Node]]
+        pop: t.Callable[[], _Node]
+        if depth_first:
+            # A stack visits the children of a node in the same order as
+            # prepending them to a queue would, without reversing them first.
+            frontier = [root]
+            pop = frontier.pop
+        else:
+            frontier = collections.deque([root])
+            pop = frontier.popleft
+        while frontier:
+            head = pop()
+            frontier.extend(head.expand())
             if head.is_solved and variables <= head.solver.solution.keys():
                 assert head.solver.is_solved, "not agnostically solvable"
                 substitution = head.solver.solution
@@ -145,31 +171,48 @@ class System:
 
 @d.dataclass(frozen=True, eq=False)
 class _RenamedRule:
+    __slots__ = ("original", "renaming", "conclusion", "premises", "constraints")
+
     original: Rule
     renaming: terms.Renaming
     conclusion: terms.Term
-    premises: Premises = ()
-    constraints: Constraints = ()
+    premises: Premises
+    constraints: Constraints
 
 
 def _create_renamed_rule(rule: Rule) -> _RenamedRule:
     renaming = {variable: variable.clone() for variable in rule.variables}
+    # The masks of the original variables select exactly the subterms of the
+    # rule which need to be rebuilt, everything else is shared with the rule.
+    # A single memo makes sure that subterms shared between the conclusion,
+    # the premises, and the constraints are renamed only once.
+    mask = rule.variables_mask
+    memo: terms.SubstitutionMemo = {}
+
+    def rename(term: terms.Term) -> terms.Term:
+        return term.substitute_memoized(renaming, mask, memo)
+
     return _RenamedRule(
         original=rule,
         renaming=renaming,
-        conclusion=rule.conclusion.substitute(renaming),
-        premises=tuple(
-            premise.substitute(renaming) for premise in rule.premises
-        ),
+        conclusion=rename(rule.conclusion),
+        premises=tuple(rename(premise) for premise in rule.premises),
         constraints=tuple(
-            (left.substitute(renaming), right.substitute(renaming))
-            for left, right in rule.constraints
+            (rename(left), rename(right)) for left, right in rule.constraints
         ),
     )
 
 
 @d.dataclass(frozen=True, eq=False)
 class _Node:
+    __slots__ = (
+        "system",
+        "solver",
+        "renamed_rules",
+        "pending_terms",
+        "pending_conditions",
+    )
+
     system: System
 
     solver: unification.Solver
@@ -177,11 +220,11 @@ class _Node:
     renamed_rules: t.Mapping[terms.Term, _RenamedRule]
 
     pending_terms: t.Tuple[terms.Term, ...]
-    pending_conditions: t.FrozenSet[t.Tuple[_RenamedRule, Condition]]
+    pending_conditions: t.Tuple[t.Tuple[_RenamedRule, Condition], ...]
 
     @classmethod
     def create_root(cls, system: System, term: terms.Term) -> _Node:
-        return cls(system, unification.Solver(), {}, (term,), frozenset())
+        return cls(system, unification.Solver(), {}, (term,), ())
 
     @property
     def is_solved(self) -> bool:
@@ -223,7 +266,7 @@ class _Node:
             solver.add_equations(renamed_rule.constraints)
             if solver.has_no_solutions:
                 continue
-            pending_conditions: t.Set[t.Tuple[_RenamedRule, Condition]] = set()
+            pending_conditions: t.List[t.Tuple[_RenamedRule, Condition]] = []
             conditions_iterator = itertools.chain(
                 self.pending_conditions,
                 ((renamed_rule, condition) for condition in rule.conditions),
@@ -240,12 +283,12 @@ class _Node:
                 if verdict is Verdict.VIOLATED:
                     break
                 elif verdict is Verdict.SATISFIABLE:
-                    pending_conditions.add((condition_instance, condition))
+                    pending_conditions.append((condition_instance, condition))
             else:
                 yield _Node(
                     self.system,
                     solver,
                     {term: renamed_rule, **self.renamed_rules},
                     renamed_rule.premises + self.pending_terms[1:],
-                    frozenset(pending_conditions),
+                    tuple(pending_conditions),
                 )
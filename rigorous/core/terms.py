@@ -8,11 +8,15 @@ import dataclasses as d
 import typing as t
 
 import abc
-import collections
 import functools
+import inspect
+import itertools
+import weakref
 
 
 class Term(abc.ABC):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def children(self) -> t.Sequence[Term]:
@@ -23,8 +27,21 @@ class Term(abc.ABC):
     def evaluated(self) -> t.Optional[Term]:
         raise NotImplementedError()
 
-    @abc.abstractmethod
     def substitute(self, substitution: Substitution) -> Term:
+        mask = get_substitution_mask(substitution)
+        if not self.variables_mask & mask:
+            return self
+        return self.substitute_memoized(substitution, mask, {})
+
+    @abc.abstractmethod
+    def substitute_memoized(
+        self, substitution: Substitution, mask: int, memo: SubstitutionMemo
+    ) -> Term:
+        """
+        Applies the substitution sharing results for identical subterms via `memo`.
+
+        The `mask` must be the result of `get_substitution_mask(substitution)`.
+        """
         raise NotImplementedError()
 
     @abc.abstractmethod
@@ -32,39 +49,54 @@ class Term(abc.ABC):
         raise NotImplementedError()
 
     def replace(self, replacement: Replacement) -> Term:
-        try:
-            return replacement[self]
-        except KeyError:
+        replaced = replacement.get(self)
+        if replaced is None:
             return self.replace_in_children(replacement)
+        return replaced
+
+    @functools.cached_property
+    def variables_mask(self) -> int:
+        """
+        A bitmask over-approximating `variables`.
+
+        Every variable sets one of `VARIABLE_MASK_BITS` bits. If the masks of two
+        terms do not intersect, they do not share any variables. A mask of zero
+        means that the term is closed.
+        """
+        if isinstance(self, Variable):
+            return self.mask
+        mask = 0
+        for child in self.children:
+            mask |= child.variables_mask
+        return mask
 
     @functools.cached_property
     def variables(self) -> t.AbstractSet[Variable]:
         if isinstance(self, Variable):
             return frozenset({self})
-        variables: t.Set[Variable] = set()
-        for child in self.children:
-            variables |= child.variables
-        return frozenset(variables)
+        if not self.variables_mask:
+            return _NO_VARIABLES
+        return _NO_VARIABLES.union(*(child.variables for child in self.children))
 
     @functools.cached_property
     def unguarded_variables(self) -> t.AbstractSet[Variable]:
-        if isinstance(self, Apply):
-            return frozenset()
+        if isinstance(self, Apply) or not self.variables_mask:
+            return _NO_VARIABLES
         elif isinstance(self, Variable):
-            return frozenset({self})
-        unguarded_variables: t.Set[Variable] = set()
-        for child in self.children:
-            unguarded_variables |= child.unguarded_variables
-        return frozenset(unguarded_variables)
+            return self.variables
+        return _NO_VARIABLES.union(
+            *(child.unguarded_variables for child in self.children)
+        )
 
     @functools.cached_property
     def guarded_variables(self) -> t.AbstractSet[Variable]:
         if isinstance(self, Apply):
             return self.variables
-        guarded_variables: t.Set[Variable] = set()
-        for child in self.children:
-            guarded_variables |= child.guarded_variables
-        return frozenset(guarded_variables)
+        elif not self.variables_mask:
+            return _NO_VARIABLES
+        return _NO_VARIABLES.union(
+            *(child.guarded_variables for child in self.children)
+        )
 
     @property
     def can_evaluate(self) -> bool:
@@ -72,7 +104,7 @@ class Term(abc.ABC):
 
     @property
     def is_closed(self) -> bool:
-        return not self.variables
+        return not self.variables_mask
 
     @property
     def is_value(self) -> bool:
@@ -104,20 +136,24 @@ class Term(abc.ABC):
                         if child not in visited:
                             pending.add(child)
         else:
-            return self.iter_preorder()
+            yield from self.iter_preorder(
+                skip_operator_arguments=skip_operator_arguments
+            )
 
     def iter_preorder(
         self, *, skip_operator_arguments: bool = False
     ) -> t.Iterator[Term]:
-        queue: t.Deque[Term] = collections.deque([self])
-        while queue:
-            term = queue.popleft()
+        stack: t.List[Term] = [self]
+        while stack:
+            term = stack.pop()
             yield term
             if not skip_operator_arguments or not isinstance(term, Apply):
-                queue.extendleft(term.children)
+                stack.extend(reversed(term.children))
 
 
 class Atom(Term, abc.ABC):
+    __slots__ = ()
+
     @property
     def children(self) -> t.Sequence[Term]:
         return ()
@@ -129,23 +165,66 @@ class Atom(Term, abc.ABC):
     def substitute(self, substitution: Substitution) -> Term:
         return self
 
+    def substitute_memoized(
+        self, substitution: Substitution, mask: int, memo: SubstitutionMemo
+    ) -> Term:
+        return self
+
     def replace_in_children(self, replacement: Replacement) -> Term:
         return self
 
 
+_NO_VARIABLES: t.FrozenSet[Variable] = frozenset()
+
+
 class Value(Atom, abc.ABC):
-    pass
+    # Values are closed, hence, their variables do not need to be computed and
+    # cached per instance. This allows values to be slotted classes.
+    __slots__ = ()
+
+    variables_mask = 0
+    variables = _NO_VARIABLES
+    unguarded_variables = _NO_VARIABLES
+    guarded_variables = _NO_VARIABLES
+
+
+# Symbols, sequences, and applications are hash-consed: structurally identical
+# terms built from the same children are shared as long as they are alive. This
+# allows equality checks to short-circuit on identity and cached properties like
+# `evaluated` and `variables` to be shared among all users of a term.
+_interned: weakref.WeakValueDictionary[
+    t.Tuple[t.Any, ...], Term
+] = weakref.WeakValueDictionary()
 
 
 @d.dataclass(frozen=True)
 class Symbol(Atom):
     symbol: str
 
+    @classmethod
+    def create(cls, symbol: str) -> Symbol:
+        key = (cls, symbol)
+        interned = _interned.get(key)
+        if interned is None:
+            interned = _interned[key] = cls(symbol)
+        return t.cast(Symbol, interned)
+
+
+VARIABLE_MASK_BITS = 64
+
+_variable_counter = itertools.count()
+
 
 @d.dataclass(frozen=True, eq=False)
 class Variable(Atom):
     name: t.Optional[str] = None
 
+    mask: int = d.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        bit = next(_variable_counter) % VARIABLE_MASK_BITS
+        object.__setattr__(self, "mask", 1 << bit)
+
     def __repr__(self) -> str:
         return f"<Variable name={self.name!r} @ {id(self):X}>"
 
@@ -156,39 +235,67 @@ class Variable(Atom):
         return Variable(name)
 
     def substitute(self, substitution: Substitution) -> Term:
-        try:
-            return substitution[self]
-        except KeyError:
-            return self
+        return substitution.get(self, self)
+
+    def substitute_memoized(
+        self, substitution: Substitution, mask: int, memo: SubstitutionMemo
+    ) -> Term:
+        return self.substitute(substitution)
 
 
 def _substitute_inner(
     parent: Term,
     terms: t.Tuple[Term, ...],
     substitution: Substitution,
+    mask: int,
+    memo: SubstitutionMemo,
     constructor: t.Callable[[t.Tuple[Term, ...]], Term],
 ) -> Term:
-    for variable in parent.variables:
-        if variable in substitution:
-            break
-    else:
+    if not parent.variables_mask & mask:
         return parent
+    result = memo.get(id(parent))
+    if result is not None:
+        return result
     is_inner_substituted = False
     substituted_terms: t.List[Term] = []
     for term in terms:
-        substituted_term = term.substitute(substitution)
+        substituted_term = term.substitute_memoized(substitution, mask, memo)
         if substituted_term is not term:
             is_inner_substituted = True
         substituted_terms.append(substituted_term)
     if is_inner_substituted:
-        return constructor(tuple(substituted_terms))
-    return parent
+        result = constructor(tuple(substituted_terms))
+    else:
+        result = parent
+    memo[id(parent)] = result
+    return result
+
+
+def _evaluate_children(children: t.Tuple[Term, ...]) -> t.Tuple[Term, ...]:
+    # Only called after all children have been checked to evaluate successfully.
+    return t.cast(t.Tuple[Term, ...], tuple(child.evaluated for child in children))
 
 
 @d.dataclass(frozen=True)
 class Sequence(Term):
     elements: t.Tuple[Term, ...]
 
+    @classmethod
+    def create(cls, elements: t.Tuple[Term, ...]) -> Sequence:
+        key = (cls, tuple(map(id, elements)))
+        interned = _interned.get(key)
+        if interned is None:
+            interned = _interned[key] = cls(elements)
+        return t.cast(Sequence, interned)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @functools.cached_property
+    def _hash(self) -> int:
+        # Terms are immutable, hence, the recursive hash is computed only once.
+        return hash(self.elements)
+
     @property
     def children(self) -> t.Sequence[Term]:
         return self.elements
@@ -196,22 +303,25 @@ class Sequence(Term):
     @functools.cached_property
     def evaluated(self) -> t.Optional[Term]:  # type: ignore
         is_inner_evaluated = False
-        evaluated_elements: t.List[Term] = []
         for element in self.elements:
-            if element.evaluated is None:
+            evaluated = element.evaluated
+            if evaluated is None:
                 return None
-            if element.evaluated is not element:
+            if evaluated is not element:
                 is_inner_evaluated = True
-            evaluated_elements.append(element.evaluated)
         if is_inner_evaluated:
-            return Sequence(tuple(evaluated_elements))
+            return Sequence.create(_evaluate_children(self.elements))
         return self
 
-    def substitute(self, substitution: Substitution) -> Term:
-        return _substitute_inner(self, self.elements, substitution, Sequence)
+    def substitute_memoized(
+        self, substitution: Substitution, mask: int, memo: SubstitutionMemo
+    ) -> Term:
+        return _substitute_inner(
+            self, self.elements, substitution, mask, memo, Sequence.create
+        )
 
     def replace_in_children(self, replacement: Replacement) -> Term:
-        return Sequence(
+        return Sequence.create(
             tuple(element.replace(replacement) for element in self.elements)
         )
 
@@ -234,40 +344,62 @@ class Apply(Term):
     operator: Operator
     arguments: Arguments
 
+    @classmethod
+    def create(cls, operator: Operator, arguments: Arguments) -> Apply:
+        key = (cls, operator, tuple(map(id, arguments)))
+        interned = _interned.get(key)
+        if interned is None:
+            interned = _interned[key] = cls(operator, arguments)
+        return t.cast(Apply, interned)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @functools.cached_property
+    def _hash(self) -> int:
+        return hash((self.operator, self.arguments))
+
     @property
     def children(self) -> t.Sequence[Term]:
         return self.arguments
 
     @functools.cached_property
     def evaluated(self) -> t.Optional[Term]:  # type: ignore
-        evaluated_arguments: t.List[Term] = []
         should_compute = True
         is_inner_evaluated = False
         for argument in self.arguments:
-            if argument.evaluated is None:
+            evaluated = argument.evaluated
+            if evaluated is None:
                 return None
-            if argument.evaluated is not argument:
+            if evaluated is not argument:
                 is_inner_evaluated = True
-            if not argument.evaluated.is_value:
+            if should_compute and not evaluated.is_value:
                 should_compute = False
-            evaluated_arguments.append(argument.evaluated)
+        if is_inner_evaluated:
+            arguments = _evaluate_children(self.arguments)
+        else:
+            arguments = self.arguments
         if should_compute:
-            return self.operator.apply(tuple(evaluated_arguments))
+            return self.operator.apply(arguments)
         elif is_inner_evaluated:
-            return Apply(self.operator, tuple(evaluated_arguments))
+            return Apply.create(self.operator, arguments)
         else:
             return self
 
-    def substitute(self, substitution: Substitution) -> Term:
+    def substitute_memoized(
+        self, substitution: Substitution, mask: int, memo: SubstitutionMemo
+    ) -> Term:
         return _substitute_inner(
             self,
             self.arguments,
             substitution,
-            lambda arguments: Apply(self.operator, arguments),
+            mask,
+            memo,
+            lambda arguments: Apply.create(self.operator, arguments),
         )
 
     def replace_in_children(self, replacement: Replacement) -> Term:
-        return Apply(
+        return Apply.create(
             self.operator,
             tuple(argument.replace(replacement) for argument in self.arguments),
         )
@@ -277,9 +409,25 @@ Replacement = t.Mapping[Term, Term]
 Substitution = t.Mapping[Variable, Term]
 Renaming = t.Mapping[Variable, Variable]
 
+# Maps the identity of already substituted terms to their substitution result.
+SubstitutionMemo = t.Dict[int, Term]
+
+
+def get_substitution_mask(substitution: Substitution) -> int:
+    """
+    Returns the union of the masks of all variables substituted by `substitution`.
+
+    A term is unaffected by the substitution if its `variables_mask` does not
+    intersect with the returned mask.
+    """
+    mask = 0
+    for variable in substitution:
+        mask |= variable.mask
+    return mask
+
 
 def sequence(*elements: t.Union[Term, str]) -> Sequence:
-    return Sequence(
+    return Sequence.create(
         tuple(
             element if isinstance(element, Term) else symbol(element)
             for element in elements
@@ -288,7 +436,7 @@ def sequence(*elements: t.Union[Term, str]) -> Sequence:
 
 
 def symbol(symbol: str) -> Symbol:
-    return Symbol(symbol)
+    return Symbol.create(symbol)
 
 
 def variable(name: str) -> Variable:
@@ -330,7 +478,7 @@ class FunctionOperator(Operator):
             result = self.implementation(arguments)
             assert result is not None, "invalid operation on primitives"
             return result
-        return Apply(self, arguments)
+        return Apply.create(self, arguments)
 
 
 def operator(implementation: Implementation) -> FunctionOperator:
@@ -356,9 +504,53 @@ class InvalidParameterTypeError(Exception):
     pass
 
 
-def function_operator(function: t.Callable[..., t.Optional[Term]]) -> FunctionOperator:
-    import inspect
+_POSITIONAL_KINDS = {
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+}
+
+
+def _specialize_implementation(
+    function: t.Callable[..., t.Optional[Term]],
+    signature: inspect.Signature,
+    types: t.Mapping[str, t.Type[Term]],
+) -> t.Optional[Implementation]:
+    """
+    Generates an implementation specialized to the parameters of `function`.
+
+    Only functions with a fixed number of positional parameters without defaults
+    are specialized, for them, the arity and type checks are unrolled into
+    straight-line code. Returns `None` for all other functions.
+    """
+    parameters = list(signature.parameters.values())
+    if any(
+        parameter.kind not in _POSITIONAL_KINDS
+        or parameter.default is not inspect.Parameter.empty
+        for parameter in parameters
+    ):
+        return None
+    names = [f"argument{index}" for index in range(len(parameters))]
+    namespace: t.Dict[str, t.Any] = {"function": function}
+    lines = [
+        "def implementation(arguments):",
+        f"    if len(arguments) != {len(parameters)}:",
+        "        return None",
+    ]
+    if names:
+        lines.append(f"    {', '.join(names)}, = arguments")
+    for name, parameter in zip(names, parameters):
+        typ = types[parameter.name]
+        # Arguments are always terms, so checking for `Term` is pointless.
+        if typ is not Term:
+            namespace[f"{name}_type"] = typ
+            lines.append(f"    if not isinstance({name}, {name}_type):")
+            lines.append("        return None")
+    lines.append(f"    return function({', '.join(names)})")
+    exec("\n".join(lines), namespace)
+    return t.cast(Implementation, namespace["implementation"])
+
 
+def function_operator(function: t.Callable[..., t.Optional[Term]]) -> FunctionOperator:
     signature = inspect.signature(function)
     type_hints = t.get_type_hints(function)
 
@@ -381,20 +573,33 @@ def function_operator(function: t.Callable[..., t.Optional[Term]]) -> FunctionOp
         if optional:
             optionals.add(parameter.name)
 
+    specialized = _specialize_implementation(function, signature, types)
+    if specialized is not None:
+        return FunctionOperator(specialized, name=getattr(function, "__name__", None))
+
+    parameters = list(signature.parameters.values())
+    if any(parameter.kind not in _POSITIONAL_KINDS for parameter in parameters):
+        raise InvalidParameterTypeError(
+            f"function operator {function} must only have positional parameters"
+        )
+    parameter_types = tuple(types[parameter.name] for parameter in parameters)
+    # Trailing parameters with a default may be omitted if they are optional.
+    minimal_arity = 0
+    for index, parameter in enumerate(parameters):
+        if (
+            parameter.default is inspect.Parameter.empty
+            or parameter.name not in optionals
+        ):
+            minimal_arity = index + 1
+    maximal_arity = len(parameters)
+
     def implementation(arguments: Arguments) -> t.Optional[Term]:
-        try:
-            bound_arguments = signature.bind(*arguments)
-        except TypeError:
+        if not minimal_arity <= len(arguments) <= maximal_arity:
             return None
-        else:
-            for parameter in signature.parameters.values():
-                argument = bound_arguments.arguments.get(parameter.name, None)
-                if argument is None:
-                    if parameter.name not in optionals:
-                        return None
-                elif not isinstance(argument, types[parameter.name]):
-                    return None
-            return function(*arguments)
+        for argument, typ in zip(arguments, parameter_types):
+            if not isinstance(argument, typ):
+                return None
+        return function(*arguments)
 
     return FunctionOperator(implementation, name=getattr(function, "__name__", None))
 
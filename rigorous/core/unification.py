@@ -22,22 +22,25 @@ class NoSolutionError(Exception):
 
 
 def _substitute(
-    term: terms.Term, substitution: terms.Substitution
+    term: terms.Term, substitution: terms.Substitution, mask: int
 ) -> terms.Term:
-    for variable in term.variables:
-        if variable in substitution:
-            return term.substitute(substitution)
+    if term.variables_mask & mask:
+        return term.substitute_memoized(substitution, mask, {})
     return term
 
 
 @d.dataclass(eq=False)
 class Solver:
     _failure: bool = False
-    _deferred: t.Set[Equation] = d.field(default_factory=set)
+    _deferred: t.List[Equation] = d.field(default_factory=list)
     _pending: t.Deque[Equation] = d.field(default_factory=collections.deque)
     _solutions: t.Dict[terms.Variable, terms.Term] = d.field(
         default_factory=dict
     )
+    _solutions_mask: int = 0
+    # Indicates whether `_solutions` may be referenced from elsewhere, i.e., by
+    # a clone or by a caller of `solution`, and must be copied before mutating.
+    _solutions_shared: bool = False
 
     def _reintegrate_deferred(self) -> None:
         self._pending.extend(self._deferred)
@@ -69,82 +72,135 @@ class Solver:
     @property
     def solution(self) -> t.Mapping[terms.Variable, terms.Term]:
         self.solve()
+        self._solutions_shared = True
         return self._solutions
 
     def merge(self, other: Solver) -> None:
         assert not other._failure
         assert self._solutions.keys().isdisjoint(other._solutions.keys())
         self._solutions = {
-            variable: solution.substitute(other._solutions)
+            variable: _substitute(
+                solution, other._solutions, other._solutions_mask
+            )
             for variable, solution in self._solutions.items()
         }
         for variable, solution in other._solutions.items():
-            self._solutions[variable] = solution.substitute(self._solutions)
+            self._solutions[variable] = _substitute(
+                solution, self._solutions, self._solutions_mask
+            )
+            self._solutions_mask |= variable.mask
+        self._solutions_shared = False
         self._pending.extend(other._pending)
         self._pending.extend(other._deferred)
         self._reintegrate_deferred()
 
+    def fork_with(
+        self, other: Solver, equations: t.Iterable[Equation]
+    ) -> t.Optional[Solver]:
+        # Closed and fully evaluated terms only unify if they are equal, hence,
+        # such conflicts are detected before any state is copied.
+        equations = tuple(equations)
+        for left, right in equations:
+            if left is not right and left.is_value and right.is_value and left != right:
+                return None
+        # Solving once after merging and adding the equations is equivalent to
+        # solving after each step as constraints only ever get stronger.
+        fork = self.clone()
+        fork.merge(other)
+        fork._pending.extend(equations)
+        fork.solve()
+        if fork._failure:
+            return None
+        return fork
+
     def solve(self) -> None:
+        if self._failure:
+            return
+        # The queues are only ever mutated in place, hence, binding them to
+        # locals once saves repeated attribute lookups in the hot loop.
+        pending = self._pending
+        deferred = self._deferred
         did_discover_solutions: bool = False
-        while self._pending and not self._failure:
-            equation = self._pending.popleft()
-            left = _substitute(equation[0], self._solutions).evaluated
-            right = _substitute(equation[1], self._solutions).evaluated
-            if left is None or right is None:
+        while pending:
+            left, right = pending.popleft()
+            solutions = self._solutions
+            mask = self._solutions_mask
+            if left.variables_mask & mask:
+                left = left.substitute_memoized(solutions, mask, {})
+            if right.variables_mask & mask:
+                right = right.substitute_memoized(solutions, mask, {})
+            evaluated_left = left.evaluated
+            evaluated_right = right.evaluated
+            if evaluated_left is None or evaluated_right is None:
                 self._failure = True
                 return
+            left, right = evaluated_left, evaluated_right
             if isinstance(right, terms.Variable):
                 if not isinstance(left, terms.Variable):
                     left, right = right, left
             if isinstance(left, terms.Variable):
-                if left in right.unguarded_variables:
+                if (
+                    left.mask & right.variables_mask
+                    and left in right.unguarded_variables
+                ):
                     self._failure = True
                     return
-                self._solutions, solutions = {}, self._solutions
+                if self._solutions_shared:
+                    solutions = self._solutions = dict(solutions)
+                    self._solutions_shared = False
+                binding = {left: right}
+                left_mask = left.mask
                 for variable, solution in solutions.items():
-                    new_solution = _substitute(
-                        solution, {left: right}
+                    if not solution.variables_mask & left_mask:
+                        continue
+                    new_solution = solution.substitute_memoized(
+                        binding, left_mask, {}
                     ).evaluated
                     if new_solution is None:
                         self._failure = True
                         return
-                    self._solutions[variable] = new_solution
-                self._solutions[left] = right
+                    solutions[variable] = new_solution
+                solutions[left] = right
+                self._solutions_mask = mask | left_mask
                 did_discover_solutions = True
             elif isinstance(left, terms.Sequence):
                 if isinstance(right, terms.Sequence):
                     if left.length != right.length:
                         self._failure = True
                         return
-                    self._pending.extend(zip(left.elements, right.elements))
+                    for element_equation in zip(left.elements, right.elements):
+                        # Identical closed and fully evaluated elements, e.g.,
+                        # the symbols of a sequence, trivially unify.
+                        left_element, right_element = element_equation
+                        if left_element is right_element and left_element.is_value:
+                            continue
+                        pending.append(element_equation)
                 elif not isinstance(right, terms.Apply):
                     self._failure = True
                     return
                 else:
-                    self._deferred.add((left, right))
+                    deferred.append((left, right))
             elif left == right:
                 if left.guarded_variables:
-                    self._deferred.add((left, right))
+                    deferred.append((left, right))
             else:
                 if not left.is_operator and not right.is_operator:
                     self._failure = True
                     return
-                self._deferred.add((left, right))
-            if (
-                not self._pending
-                and not self._failure
-                and self._deferred
-                and did_discover_solutions
-            ):
+                deferred.append((left, right))
+            if not pending and deferred and did_discover_solutions:
                 did_discover_solutions = False
                 self._reintegrate_deferred()
 
     def clone(self) -> Solver:
+        self._solutions_shared = True
         return Solver(
             _failure=self._failure,
-            _deferred=set(self._deferred),
+            _deferred=list(self._deferred),
             _pending=collections.deque(self._pending),
             _solutions=self._solutions,
+            _solutions_mask=self._solutions_mask,
+            _solutions_shared=True,
         )
 
 
@@ -2,27 +2,13 @@
 #
 # Copyright (C) 2020, Maximilian Köhl <mail@koehlma.de>
 
-from __future__ import annotations
-
-import dataclasses as d
-import typing as t
-
-from ..core import terms
-
-
-@d.dataclass(frozen=True)
-class Boolean(terms.Value):
-    value: bool
+"""
+Deprecated alias of :mod:`rigorous.data.booleans`.
+"""
 
+from __future__ import annotations
 
-TRUE = Boolean(True)
-FALSE = Boolean(False)
+from .booleans import Boolean, FALSE, TRUE, land
 
 
-@terms.operator
-@terms.check_arity(2)
-def land(arguments: terms.Arguments) -> t.Optional[terms.Term]:
-    x, y = arguments
-    if isinstance(x, Boolean) and isinstance(y, Boolean):
-        return Boolean(x.value and y.value)
-    return None
+__all__ = ["Boolean", "FALSE", "TRUE", "land"]
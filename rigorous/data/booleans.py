@@ -14,6 +14,8 @@ from ..core import inference, terms
 
 @d.dataclass(frozen=True)
 class Boolean(terms.Value):
+    __slots__ = ("value",)
+
     value: bool
 
 
@@ -9,9 +9,13 @@ import typing as t
 
 from ..core import terms
 
+from . import numbers
+
 
 @d.dataclass(frozen=True)
 class Integer(terms.Value):
+    __slots__ = ("value",)
+
     value: int
 
 
@@ -20,7 +24,7 @@ class Integer(terms.Value):
 def add(arguments: terms.Arguments) -> t.Optional[terms.Term]:
     x, y = arguments
     if isinstance(x, Integer) and isinstance(y, Integer):
-        return Integer(x.value + y.value)
+        return integer(x.value + y.value)
     return None
 
 
@@ -29,9 +33,15 @@ def add(arguments: terms.Arguments) -> t.Optional[terms.Term]:
 def sub(arguments: terms.Arguments) -> t.Optional[terms.Term]:
     x, y = arguments
     if isinstance(x, Integer) and isinstance(y, Integer):
-        return Integer(x.value - y.value)
+        return integer(x.value - y.value)
     return None
 
 
+_SMALL_INTEGERS = {value: Integer(value) for value in numbers.SMALL_INTEGER_RANGE}
+
+
 def integer(value: int) -> Integer:
-    return Integer(value)
+    try:
+        return _SMALL_INTEGERS[value]
+    except KeyError:
+        return Integer(value)
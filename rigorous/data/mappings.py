@@ -14,6 +14,8 @@ from ..core import terms
 
 @d.dataclass(frozen=True)
 class Mapping(terms.Value, t.Mapping[terms.Term, terms.Term]):
+    __slots__ = ("entries",)
+
     entries: immutables.Map[terms.Term, terms.Term]
 
     def __getitem__(self, key: terms.Term) -> terms.Term:
@@ -25,6 +27,18 @@ class Mapping(terms.Value, t.Mapping[terms.Term, terms.Term]):
     def __len__(self) -> int:
         return len(self.entries)
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        # Heaps are mappings but never equal to plain mappings.
+        if not isinstance(other, Mapping) or other.__class__ is not self.__class__:
+            return NotImplemented
+        # Maps cache their hash, so comparing the hashes first is cheap.
+        return (
+            hash(self.entries) == hash(other.entries)
+            and self.entries == other.entries
+        )
+
     def setitem(self, key: terms.Term, value: terms.Term) -> Mapping:
         assert key.is_value and value.is_value
         return Mapping(self.entries.set(key, value))
@@ -35,6 +49,8 @@ class Mapping(terms.Value, t.Mapping[terms.Term, terms.Term]):
 
 def create(base: t.Mapping[terms.Term, terms.Term]) -> Mapping:
     assert all(key.is_value and value.is_value for key, value in base.items())
+    if isinstance(base, immutables.Map):
+        return Mapping(base)
     return Mapping(immutables.Map(base))
 
 
@@ -66,9 +82,10 @@ def delitem(mapping: Mapping, key: terms.Term) -> t.Optional[terms.Term]:
 
 @terms.operator
 def construct(arguments: terms.Arguments) -> t.Optional[terms.Term]:
-    if len(arguments) % 2 != 0:
+    length = len(arguments)
+    if length % 2 != 0:
         return None
     entries: t.Dict[terms.Term, terms.Term] = {}
-    for key, value in zip(arguments[::2], arguments[1::2]):
-        entries[key] = value
+    for index in range(0, length, 2):
+        entries[arguments[index]] = arguments[index + 1]
     return Mapping(immutables.Map(entries))
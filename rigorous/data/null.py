@@ -11,7 +11,7 @@ from ..core import terms
 
 @d.dataclass(frozen=True)
 class Null(terms.Value):
-    pass
+    __slots__ = ()
 
 
 NULL = Null()
@@ -13,16 +13,22 @@ from ..core import terms
 
 
 class Number(terms.Value, abc.ABC):
+    __slots__ = ()
+
     value: t.Union[int, float]
 
 
 @d.dataclass(frozen=True)
 class Integer(Number):
+    __slots__ = ("value",)
+
     value: int
 
 
 @d.dataclass(frozen=True)
 class Float(Number):
+    __slots__ = ("value",)
+
     value: float
 
 
@@ -73,31 +79,54 @@ def neg(operand: Number) -> Number:
 
 @terms.function_operator
 def shift_left(left: Integer, right: Integer) -> Integer:
-    return Integer(left.value >> right.value)
+    return create_integer(left.value << right.value)
 
 
 @terms.function_operator
 def shift_right(left: Integer, right: Integer) -> Integer:
-    return Integer(left.value >> right.value)
+    return create_integer(left.value >> right.value)
 
 
 @terms.function_operator
 def bitwise_and(left: Integer, right: Integer) -> Integer:
-    return Integer(left.value & right.value)
+    return create_integer(left.value & right.value)
 
 
 @terms.function_operator
 def bitwise_or(left: Integer, right: Integer) -> Integer:
-    return Integer(left.value | right.value)
+    return create_integer(left.value | right.value)
 
 
 @terms.function_operator
 def bitwise_xor(left: Integer, right: Integer) -> Integer:
-    return Integer(left.value ^ right.value)
+    return create_integer(left.value ^ right.value)
+
+
+# Small integers are by far the most common, so they are shared. The range is
+# also used for the integers of `rigorous.data.integers`.
+SMALL_INTEGER_RANGE = range(-128, 1025)
+
+_SMALL_INTEGERS = {value: Integer(value) for value in SMALL_INTEGER_RANGE}
+
+
+def create_integer(value: int) -> Integer:
+    integer = _SMALL_INTEGERS.get(value)
+    if integer is None:
+        return Integer(value)
+    return integer
+
+
+_CONSTRUCTORS: t.Dict[type, t.Callable[[t.Any], Number]] = {
+    int: create_integer,
+    float: Float,
+}
 
 
 def create(value: t.Union[int, float]) -> Number:
-    if isinstance(value, int):
+    constructor = _CONSTRUCTORS.get(type(value))
+    if constructor is not None:
+        return constructor(value)
+    elif isinstance(value, int):
         return Integer(value)
     else:
         return Float(value)
@@ -16,8 +16,18 @@ from . import strings, tuples
 
 @d.dataclass(frozen=True)
 class Record(terms.Value):
+    __slots__ = ("fields",)
+
     fields: immutables.Map[str, terms.Term]
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Record):
+            return NotImplemented
+        # Maps cache their hash, so comparing the hashes first is cheap.
+        return hash(self.fields) == hash(other.fields) and self.fields == other.fields
+
     def getfield(self, name: str) -> terms.Term:
         return self.fields[name]
 
@@ -63,13 +73,16 @@ def setfield(
 
 @terms.operator
 def construct(arguments: terms.Arguments) -> t.Optional[terms.Term]:
-    if len(arguments) % 2 != 0:
+    length = len(arguments)
+    if length % 2 != 0:
         return None
     fields: t.Dict[str, terms.Term] = {}
-    for field, value in zip(arguments[::2], arguments[1::2]):
-        if not isinstance(field, strings.String):
+    for index in range(0, length, 2):
+        field = arguments[index]
+        # Strings have no subclasses, so comparing the type suffices.
+        if type(field) is not strings.String:
             return None
-        fields[field.value] = value
+        fields[field.value] = arguments[index + 1]
     return Record(immutables.Map(fields))
 
 
@@ -77,5 +90,5 @@ def construct(arguments: terms.Arguments) -> t.Optional[terms.Term]:
 def add(this: Record, item: tuples.Tuple) -> t.Optional[terms.Term]:
     assert len(item.components) == 2
     field, value = item.components
-    assert isinstance(field, strings.String)
+    assert type(field) is strings.String
     return this.setfield(field.value, value)
@@ -12,15 +12,22 @@ from ..core import terms
 from . import booleans, mappings
 
 
-@d.dataclass(frozen=True)
+@d.dataclass(frozen=True, init=False)
 class Reference(terms.Value):
-    name: t.Optional[str] = None
-    address: t.Optional[int] = None
+    __slots__ = ("name", "address")
+
+    name: t.Optional[str]
+    address: t.Optional[int]
 
-    def __post_init__(self) -> None:
+    # Slots cannot have class-level defaults, so the defaults live here.
+    def __init__(
+        self, name: t.Optional[str] = None, address: t.Optional[int] = None
+    ) -> None:
         assert (
-            self.name is not None or self.address is not None
+            name is not None or address is not None
         ), "reference must either be named or have an address"
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "address", address)
 
 
 NULL = Reference("NULL")
@@ -33,7 +40,9 @@ def is_reference(term: terms.Term) -> terms.Term:
 
 @d.dataclass(frozen=True)
 class Heap(mappings.Mapping):
-    next_address: int = 0
+    __slots__ = ("next_address",)
+
+    next_address: int
 
 
 @terms.function_operator
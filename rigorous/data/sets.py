@@ -14,11 +14,15 @@ from . import booleans
 
 @d.dataclass(frozen=True)
 class Set(terms.Value):
+    __slots__ = ("members",)
+
     members: t.FrozenSet[terms.Term]
 
 
 def create(base: t.AbstractSet[terms.Term]) -> Set:
     assert all(element.is_value for element in base)
+    if isinstance(base, frozenset):
+        return Set(base)
     return Set(frozenset(base))
 
 
@@ -34,12 +38,16 @@ def not_contains(this: Set, value: terms.Term) -> booleans.Boolean:
 
 @terms.function_operator
 def add(this: Set, value: terms.Term) -> Set:
-    return Set(this.members | {value})
+    if value in this.members:
+        return this
+    return Set(this.members.union((value,)))
 
 
 @terms.function_operator
 def remove(this: Set, value: terms.Term) -> Set:
-    return Set(this.members - {value})
+    if value not in this.members:
+        return this
+    return Set(this.members.difference((value,)))
 
 
 @terms.function_operator
@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import dataclasses as d
 
+import functools
+
 from ..core import terms
 
 from . import booleans
@@ -13,9 +15,13 @@ from . import booleans
 
 @d.dataclass(frozen=True)
 class String(terms.Value):
+    __slots__ = ("value",)
+
     value: str
 
 
+# Identifiers and attribute names are created over and over again.
+@functools.lru_cache(maxsize=4096)
 def create(value: str) -> String:
     return String(value)
 
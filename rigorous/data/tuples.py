@@ -12,16 +12,41 @@ from ..core import terms
 from . import numbers
 
 
+class _HashedValue(terms.Value):
+    # A slot cannot be declared in the same class as a field with a specifier, the
+    # specifier would conflict with the slot. Hence, the slot lives in a base.
+    __slots__ = ("_hash",)
+
+
 @d.dataclass(frozen=True)
-class Tuple(terms.Value):
-    components: t.Tuple[terms.Term, ...] = ()
+class Tuple(_HashedValue):
+    __slots__ = ("components",)
+
+    components: t.Tuple[terms.Term, ...]
+
+    # Unlike the maps and frozen sets backing the other containers, tuples do
+    # not cache their hash. The hash is thus computed once on construction.
+    _hash: int = d.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash(self.components))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Tuple):
+            return NotImplemented
+        return self._hash == other._hash and self.components == other.components
 
 
 def create(*components: terms.Term) -> Tuple:
     return Tuple(components)
 
 
-EMPTY = Tuple()
+EMPTY = Tuple(())
 
 
 @terms.function_operator
@@ -69,6 +94,10 @@ def pop_left(this: Tuple) -> t.Optional[Tuple]:
 
 @terms.function_operator
 def concat(left: Tuple, right: Tuple) -> Tuple:
+    if not right.components:
+        return left
+    elif not left.components:
+        return right
     return Tuple(left.components + right.components)
 
 
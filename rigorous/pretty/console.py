@@ -57,28 +57,33 @@ else:
     _COLOR_MAP = {color: "" for color in Color}
 
 
-@d.dataclass(frozen=True, order=True)
-class Position:
+class Position(t.NamedTuple):
     row: int = 0
     column: int = 0
 
 
-@d.dataclass(frozen=True, order=True)
-class Chunk:
-    position: Position
-    text: str
-    columns: int
+# A chunk of text rendered in a row given as `(column, text, columns)`.
+_Chunk = t.Tuple[int, str, int]
 
 
 @d.dataclass(eq=False)
 class Canvas:
     colorize: bool = True
-    chunks: t.Set[Chunk] = d.field(default_factory=set)
+    rows: t.Dict[int, t.Set[_Chunk]] = d.field(default_factory=dict)
     position: Position = Position()
     stack: t.List[Position] = d.field(default_factory=list)
 
+    # The text of the rows which did not change since they were last rendered.
+    _lines: t.Dict[int, str] = d.field(default_factory=dict, init=False, repr=False)
+
     def render_text(self, text: str, *, columns: t.Optional[int] = None) -> None:
-        self.chunks.add(Chunk(self.position, text, columns or len(text)))
+        row = self.position.row
+        chunk = (self.position.column, text, columns or len(text))
+        try:
+            self.rows[row].add(chunk)
+        except KeyError:
+            self.rows[row] = {chunk}
+        self._lines.pop(row, None)
 
     def store_position(self) -> None:
         self.stack.append(self.position)
@@ -91,23 +96,27 @@ class Canvas:
             self.position.row + delta_rows, self.position.column + delta_columns
         )
 
+    def _render_row(self, row: int) -> str:
+        column = 0
+        line: t.List[str] = []
+        for chunk_column, text, columns in sorted(self.rows.get(row, ())):
+            if chunk_column > column:
+                line.append(" " * (chunk_column - column))
+            line.append(text)
+            column = chunk_column + columns
+        return "".join(line)
+
     @property
     def text(self) -> str:
-        row, column = 0, 0
-        lines: t.List[t.List[str]] = []
-        line: t.List[str] = []
-        for chunk in sorted(self.chunks):
-            while chunk.position.row > row:
-                lines.append(line)
-                line = []
-                column = 0
-                row += 1
-            if chunk.position.column > column:
-                line.append(" " * (chunk.position.column - column))
-            line.append(chunk.text)
-            column = chunk.position.column + chunk.columns
-        lines.append(line)
-        return "\n".join("".join(line) for line in lines)
+        if not self.rows:
+            return ""
+        lines: t.List[str] = []
+        for row in range(max(self.rows) + 1):
+            line = self._lines.get(row)
+            if line is None:
+                line = self._lines[row] = self._render_row(row)
+            lines.append(line)
+        return "\n".join(lines)
 
 
 class Box(abc.ABC):
@@ -148,12 +157,15 @@ class Fragment(Box):
     def rows(self) -> int:
         return 1
 
+    @functools.cached_property
+    def colored_text(self) -> str:
+        if self.color is None:
+            return self.text
+        return _COLOR_MAP[self.color] + self.text + _COLOR_MAP[Color.RESET]
+
     def render(self, canvas: Canvas) -> None:
         if self.color and canvas.colorize:
-            canvas.render_text(
-                _COLOR_MAP[self.color] + self.text + _COLOR_MAP[Color.RESET],
-                columns=len(self.text),
-            )
+            canvas.render_text(self.colored_text, columns=len(self.text))
         else:
             canvas.render_text(self.text)
 
@@ -198,57 +210,77 @@ class Container(Box, abc.ABC):
         else:
             return max(child.rows for child in self.children)
 
-    def render(self, canvas: Canvas) -> None:
-        canvas.store_position()
+    @functools.cached_property
+    def offsets(self) -> t.Sequence[t.Tuple[Box, int, int]]:
+        """
+        The children with their row and column offsets relative to the container.
+        """
+        offsets: t.List[t.Tuple[Box, int, int]] = []
+        horizontal = self.direction is Direction.HORIZONTAL
+        space = self.rows if horizontal else self.columns
+        offset = 0
         for child in self.children:
-            space = (
-                self.rows if self.direction is Direction.HORIZONTAL else self.columns
-            )
-            size = (
-                child.rows if self.direction is Direction.HORIZONTAL else child.columns
-            )
+            size = child.rows if horizontal else child.columns
             delta = 0
             if self.alignment is Alignment.CENTER:
                 delta = (space - size) // 2
             elif self.alignment is Alignment.END:
                 delta = space - size
-            canvas.store_position()
-            if self.direction is Direction.HORIZONTAL:
-                canvas.advance(delta_rows=delta)
+            if horizontal:
+                offsets.append((child, delta, offset))
+                offset += child.columns + self.spacing
             else:
-                canvas.advance(delta_columns=delta)
+                offsets.append((child, offset, delta))
+                offset += child.rows + self.spacing
+        return offsets
+
+    def render(self, canvas: Canvas) -> None:
+        for child, delta_rows, delta_columns in self.offsets:
+            canvas.store_position()
+            canvas.advance(delta_rows, delta_columns)
             child.render(canvas)
             canvas.restore_position()
-            if self.direction is Direction.HORIZONTAL:
-                canvas.advance(delta_columns=child.columns + self.spacing)
-            else:
-                canvas.advance(delta_rows=child.rows + self.spacing)
-        canvas.restore_position()
 
 
-def get_term_color(term: terms.Term) -> t.Optional[Color]:
-    if isinstance(term, terms.Symbol):
+def _get_term_class_color(cls: t.Type[terms.Term]) -> t.Optional[Color]:
+    if issubclass(cls, terms.Symbol):
         return Color.CYAN
-    elif isinstance(term, terms.Variable):
+    elif issubclass(cls, terms.Variable):
         return Color.MAGENTA
-    elif isinstance(term, terms.Value):
+    elif issubclass(cls, terms.Value):
         return Color.GREEN
     return None
 
 
+# The color only depends on the class of a term, so it is computed once per class.
+_term_colors: t.Dict[t.Type[terms.Term], t.Optional[Color]] = {}
+
+
+def get_term_color(term: terms.Term) -> t.Optional[Color]:
+    cls = type(term)
+    if cls not in _term_colors:
+        _term_colors[cls] = _get_term_class_color(cls)
+    return _term_colors[cls]
+
+
 def boxify_box(box: render.Box, term: t.Optional[terms.Term] = None) -> Container:
     fragments: t.List[Fragment] = []
-    stack: t.List[t.Tuple[render.Element, t.Optional[terms.Term]]] = [(box, term)]
+    # The stack holds the iterators over the elements of the boxes being
+    # visited together with the term the elements belong to.
+    stack: t.List[t.Tuple[t.Iterator[render.Element], t.Optional[terms.Term]]] = [
+        (iter((box,)), term)
+    ]
     while stack:
-        element, term = stack.pop()
-        if isinstance(element, render.Chunk):
+        elements, term = stack[-1]
+        element = next(elements, None)
+        if element is None:
+            stack.pop()
+        elif isinstance(element, render.Chunk):
             color = None if term is None else get_term_color(term)
             fragments.append(Fragment(element.text, color=color))
-            continue
-        assert isinstance(element, render.Box), f"unexpected non-box element {element}"
-        stack.extend(
-            (child, element.term or term) for child in reversed(element.elements)
-        )
+        else:
+            assert isinstance(element, render.Box), f"unexpected non-box element {element}"
+            stack.append((iter(element.elements), element.term or term))
     return Container(fragments)
 
 
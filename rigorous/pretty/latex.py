@@ -6,40 +6,31 @@ from __future__ import annotations
 
 import typing as t
 
-import functools
-import re
-
 from ..core import inference, terms
 
 from . import render
 
 
-_LATEX_ESCAPE = {
-    "&": r"\&",
-    "%": r"\%",
-    "$": r"\$",
-    "#": r"\#",
-    "_": r"\_",
-    "{": r"\{",
-    "}": r"\}",
-    "~": r"\textasciitilde{}",
-    "^": r"\textasciicircum{}",
-    "\\": r"\textbackslash{}",
-    ">>": r">{}>",
-    "<<": r"<{}<",
-}
-
-_latex_escape_pattern = re.compile(
-    "|".join(re.escape(source) for source in _LATEX_ESCAPE)
+_LATEX_ESCAPE = str.maketrans(
+    {
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "{": r"\{",
+        "}": r"\}",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+        "\\": r"\textbackslash{}",
+    }
 )
 
 
-def _escape_replace(match: t.Match[str]) -> str:
-    return _LATEX_ESCAPE[match[0]]
-
-
 def latex_escape(source: str) -> str:
-    return _latex_escape_pattern.sub(_escape_replace, source)
+    # Single characters are escaped in one pass, `>>` and `<<` are broken up
+    # afterwards as they may otherwise be interpreted as ligatures.
+    return source.translate(_LATEX_ESCAPE).replace(">>", ">{}>").replace("<<", "<{}<")
 
 
 def get_term_color(term: terms.Term) -> t.Optional[str]:
@@ -54,29 +45,51 @@ def get_term_color(term: terms.Term) -> t.Optional[str]:
 
 def latexify_box(box: render.Box) -> str:
     chunks: t.List[str] = []
-    stack: t.List[t.Union[str, render.Element]] = [box]
-    while stack:
-        top = stack.pop()
-        if isinstance(top, str):
-            chunks.append(top)
-        elif isinstance(top, render.Chunk):
-            chunks.append(top.math or f"\\texttt{{{latex_escape(top.text)}}}")
+
+    def emit(element: render.Element, outer_color: t.Optional[str]) -> None:
+        if isinstance(element, render.Chunk):
+            chunks.append(element.math or f"\\texttt{{{latex_escape(element.text)}}}")
         else:
-            assert isinstance(top, render.Box), f"unexpected non-box element {top}"
-            if (special := latexify_special(box.special)) is not None:
-                chunks.append(special)
+            assert isinstance(element, render.Box), f"unexpected non-box element {element}"
+            special = element.special
+            latexify = None if special is None else _latexify_special.get(type(special))
+            if latexify is not None:
+                chunks.append(latexify(special))
             else:
-                color = top.term and get_term_color(top.term)
-                if color is not None:
+                color = None if element.term is None else get_term_color(element.term)
+                if color is None or color == outer_color:
+                    for child in element.elements:
+                        emit(child, outer_color)
+                else:
                     chunks.append(f"{{\\color{{{color}}}")
-                    stack.append("}")
-                stack.extend(reversed(top.elements))
+                    for child in element.elements:
+                        emit(child, color)
+                    chunks.append("}")
+
+    emit(box, None)
     return " ".join(chunks)
 
 
-@functools.singledispatch
+_LatexifySpecialT = t.TypeVar("_LatexifySpecialT", bound=t.Callable[[t.Any], str])
+
+_latexify_special: t.Dict[t.Type[render.Special], t.Callable[[t.Any], str]] = {}
+
+
+def register_latexify_special(
+    special_type: t.Type[render.Special],
+) -> t.Callable[[_LatexifySpecialT], _LatexifySpecialT]:
+    def decorator(latexify: _LatexifySpecialT) -> _LatexifySpecialT:
+        _latexify_special[special_type] = latexify
+        return latexify
+
+    return decorator
+
+
 def latexify_special(special: render.Special) -> t.Optional[str]:
-    return None
+    latexify = _latexify_special.get(type(special))
+    if latexify is None:
+        return None
+    return latexify(special)
 
 
 def latexify_term(term: terms.Term, renderer: render.Renderer) -> str:
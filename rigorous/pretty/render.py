@@ -10,8 +10,6 @@ import typing as t
 import abc
 import functools
 
-from mxu.itertools import iter_lookahead
-
 from ..core import inference, terms, unification
 from ..data import (
     booleans,
@@ -29,25 +27,49 @@ from . import define
 
 
 class Element(abc.ABC):
-    pass
+    __slots__ = ()
 
 
-@d.dataclass(frozen=True)
+# Rendering creates a chunk or box for almost every node of a term, hence, they
+# use slots and take their optional arguments in handwritten constructors.
+
+
+@d.dataclass(frozen=True, init=False)
 class Chunk(Element):
+    __slots__ = ("text", "math")
+
     text: str
-    math: t.Optional[str] = None
+    math: t.Optional[str]
 
+    def __init__(self, text: str, math: t.Optional[str] = None) -> None:
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "math", math)
 
-@d.dataclass(frozen=True)
+
+@d.dataclass(frozen=True, init=False)
 class Box(Element):
+    __slots__ = ("elements", "truncate", "term", "special")
+
     elements: t.Tuple[Element, ...]
-    truncate: bool = False
-    term: t.Optional[terms.Term] = None
-    special: t.Optional[Special] = None
+    truncate: bool
+    term: t.Optional[terms.Term]
+    special: t.Optional[Special]
+
+    def __init__(
+        self,
+        elements: t.Tuple[Element, ...],
+        truncate: bool = False,
+        term: t.Optional[terms.Term] = None,
+        special: t.Optional[Special] = None,
+    ) -> None:
+        object.__setattr__(self, "elements", elements)
+        object.__setattr__(self, "truncate", truncate)
+        object.__setattr__(self, "term", term)
+        object.__setattr__(self, "special", special)
 
 
 class Special(Element, abc.ABC):
-    pass
+    __slots__ = ()
 
 
 class RenderSpecial(t.Protocol):
@@ -82,6 +104,9 @@ class BoxBuilder:
             special=special or self.special,
         )
 
+    def append(self, element: Element) -> None:
+        self.elements.append(element)
+
     def append_chunk(self, text: str, *, math: t.Optional[str] = None) -> None:
         self.elements.append(Chunk(text, math=math))
 
@@ -89,16 +114,71 @@ class BoxBuilder:
         self.elements.append(self.renderer.render_term(term))
 
 
+# Chunks for the punctuation of terms, shared by all rendered terms.
+_PAREN_OPEN = Chunk("(", math="\\left(")
+_PAREN_CLOSE = Chunk(")", math="\\right)")
+_SPACE = Chunk(" ", math="\\ ")
+_ARGUMENTS_OPEN = Chunk("(", math="{{")
+_ARGUMENTS_CLOSE = Chunk(")", math="}}")
+_COMMA_SPACE = Chunk(", ", math=",\\ ")
+_INDEX_OPEN = Chunk("[", math="\\mxPreApplySkip\\left[")
+_BRACKET_OPEN = Chunk("[", math="\\left[")
+_BRACKET_CLOSE = Chunk("]", math="\\right]")
+_MAPSTO = Chunk(" ↦ ", math="\\mapsto")
+_LNOT = Chunk("¬", math="\\lnot")
+_DEFAULT = Chunk("?", math="?")
+_DOT = Chunk(".", math=".")
+_ASSIGN = Chunk(" := ", math=":=")
+_NOT_IN = Chunk(" ∉ ", math="\\not\\in")
+_IN = Chunk(" ∈ ", math="\\in")
+_ANGLE_OPEN = Chunk("⟨", math="\\left\\langle")
+_ANGLE_CLOSE = Chunk("⟩", math="\\right\\rangle")
+_COLON = Chunk(": ", math=":")
+_COMMA = Chunk(", ", math=",")
+_TRUE = Chunk("true", math="\\texttt{true}")
+_FALSE = Chunk("false", math="\\texttt{false}")
+_BRACE_OPEN = Chunk("{", math="\\left\\{")
+_BRACE_CLOSE = Chunk("}", math="\\right\\}")
+_BOTTOM = Chunk("⊥", math="\\bot")
+_HEAP = Chunk("HEAP")
+_TUPLE_OPEN = Chunk("⟨", math="\\left[\\,")
+_TUPLE_CLOSE = Chunk("⟩", math="\\,\\right]")
+
+_BOX_CACHE_SIZE = 4096
+
+
 @d.dataclass(eq=False)
 class Renderer:
     _special_patterns: t.List[SpecialPattern] = d.field(default_factory=list)
     _symbol_to_math: t.Dict[str, str] = d.field(default_factory=dict)
 
+    # Terms are immutable, hence, their boxes can be reused as long as the
+    # patterns and math symbols of the renderer do not change. Equal values, e.g.,
+    # `0.0` and `-0.0`, may render differently, hence, boxes are keyed by identity.
+    # A box references its term, so the identity is not reused while it is cached.
+    _box_cache: t.Dict[int, Box] = d.field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Symbols are interned and form a small domain, hence, their chunks are kept.
+    # Variables are not cached as rule applications constantly create fresh ones.
+    _symbol_chunks: t.Dict[terms.Symbol, Chunk] = d.field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Only patterns with the same root as an evaluated term or a variable or an
+    # application at the root may match the term, the others are never tried.
+    _patterns_by_root: t.Dict[t.Hashable, t.Tuple[SpecialPattern, ...]] = d.field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def add_pattern(self, pattern: SpecialPattern) -> None:
         self._special_patterns.append(pattern)
+        self._box_cache.clear()
+        self._patterns_by_root.clear()
 
     def add_math_symbol(self, symbol: str, math: str) -> None:
         self._symbol_to_math[symbol] = math
+        self._box_cache.clear()
+        self._symbol_chunks.clear()
 
     def render_condition(
         self,
@@ -110,10 +190,37 @@ class Renderer:
         return builder.build()
 
     def render_term(self, term: terms.Term) -> Box:
+        box = self._box_cache.get(id(term))
+        if box is None:
+            box = self._box_cache[id(term)] = self._build_box(term)
+            if len(self._box_cache) > _BOX_CACHE_SIZE:
+                del self._box_cache[next(iter(self._box_cache))]
+        return box
+
+    def _build_box(self, term: terms.Term) -> Box:
         builder = BoxBuilder(self)
         self._render_term(term, builder)
+        if not self._special_patterns:
+            return builder.build(term=term)
         special = None
-        for pattern in self._special_patterns:
+        # Matching unifies with the evaluated term, if it cannot be evaluated, no
+        # pattern matches it.
+        evaluated = term.evaluated
+        if evaluated is None:
+            return builder.build(term=term)
+        root = _get_root_key(evaluated)
+        if root is None:
+            patterns: t.Sequence[SpecialPattern] = self._special_patterns
+        else:
+            try:
+                patterns = self._patterns_by_root[root]
+            except KeyError:
+                patterns = self._patterns_by_root[root] = tuple(
+                    pattern
+                    for pattern in self._special_patterns
+                    if _get_root_key(pattern.pattern) in (root, None)
+                )
+        for pattern in patterns:
             substitution = unification.match(pattern.pattern, term)
             if substitution is not None:
                 special = pattern.render(
@@ -125,11 +232,13 @@ class Renderer:
                 break
         return builder.build(term=term, special=special)
 
-    @functools.singledispatchmethod
     def _render_term(self, term: terms.Term, builder: BoxBuilder) -> None:
-        raise NotImplementedError(f"`_render_term` not implemented for {type(term)}")
+        cls = type(term)
+        render = _term_renderers.get(cls)
+        if render is None:
+            render = _resolve_term_renderer(cls)
+        render(self, term, builder)
 
-    @_render_term.register
     def _render_variable(self, term: terms.Variable, builder: BoxBuilder) -> None:
         info = define.get_variable_info(term)
         text = term.name
@@ -137,32 +246,85 @@ class Renderer:
         if info is not None:
             text = info.text or term.name
             math = info.math
-        builder.append_chunk(text or "unnamed", math=math)
+        builder.elements.append(Chunk(text or "unnamed", math=math))
 
-    @_render_term.register
     def _render_symbol(self, term: terms.Symbol, builder: BoxBuilder) -> None:
-        builder.append_chunk(
-            term.symbol, math=self._symbol_to_math.get(term.symbol, None)
-        )
+        chunk = self._symbol_chunks.get(term)
+        if chunk is None:
+            chunk = self._symbol_chunks[term] = Chunk(
+                term.symbol, math=self._symbol_to_math.get(term.symbol, None)
+            )
+        builder.elements.append(chunk)
 
-    @_render_term.register
     def _render_sequence(self, term: terms.Sequence, builder: BoxBuilder) -> None:
-        builder.append_chunk("(", math="\\left(")
-        for child, lookahead in iter_lookahead(term.elements):
-            builder.append_term(child)
-            if lookahead:
-                builder.append_chunk(" ", math="\\ ")
-        builder.append_chunk(")", math="\\right)")
-
-    @_render_term.register
-    def _render_value(self, term: terms.Value, builder: BoxBuilder) -> None:
-        render_value(term, builder)
-
-    @_render_term.register
+        builder.append(_PAREN_OPEN)
+        elements = term.elements
+        if len(elements) == 3:
+            # Binary expressions are the most common sequences.
+            left, operator, right = elements
+            builder.append_term(left)
+            builder.append(_SPACE)
+            builder.append_term(operator)
+            builder.append(_SPACE)
+            builder.append_term(right)
+        else:
+            append = builder.elements.append
+            render_term = self.render_term
+            for index, child in enumerate(elements):
+                if index:
+                    append(_SPACE)
+                append(render_term(child))
+        builder.append(_PAREN_CLOSE)
+
     def _render_apply(self, term: terms.Apply, builder: BoxBuilder) -> None:
         render_operator(term.operator, term.arguments, builder)
 
 
+def _get_root_key(term: terms.Term) -> t.Hashable:
+    # Variables and applications may unify with terms of any root, their key is
+    # `None`. Evaluation preserves the length of sequences.
+    if isinstance(term, terms.Sequence):
+        return terms.Sequence, len(term.elements)
+    elif isinstance(term, terms.Symbol):
+        return term
+    elif isinstance(term, (terms.Variable, terms.Apply)):
+        return None
+    return type(term)
+
+
+_TermRenderer = t.Callable[[Renderer, t.Any, BoxBuilder], None]
+
+
+def _render_value(renderer: Renderer, term: terms.Value, builder: BoxBuilder) -> None:
+    # Values are always dispatched through `render_value` which keeps its own cache
+    # up to date when renderers for further classes of values are registered.
+    render_value(term, builder)
+
+
+_BASE_TERM_RENDERERS: t.Mapping[type, _TermRenderer] = {
+    terms.Variable: Renderer._render_variable,
+    terms.Symbol: Renderer._render_symbol,
+    terms.Sequence: Renderer._render_sequence,
+    terms.Apply: Renderer._render_apply,
+    terms.Value: _render_value,
+}
+
+# Caches the renderer for each class of terms such that rendering a term takes a
+# single dictionary lookup instead of going through `functools.singledispatch`.
+_term_renderers: t.Dict[type, _TermRenderer] = {}
+
+
+def _resolve_term_renderer(cls: t.Type[terms.Term]) -> _TermRenderer:
+    for base in cls.__mro__:
+        try:
+            renderer = _BASE_TERM_RENDERERS[base]
+        except KeyError:
+            continue
+        _term_renderers[cls] = renderer
+        return renderer
+    raise NotImplementedError(f"`_render_term` not implemented for {cls}")
+
+
 @functools.singledispatch
 def render_value(value: terms.Value, builder: BoxBuilder) -> None:
     raise NotImplementedError(f"`render_value` not implemented for {value}")
@@ -222,12 +384,12 @@ def render_function_operator(
             builder.append_chunk(
                 operator.name, math=f"\\applyFunction{{\\texttt{{{operator.name}}}}}",
             )
-            builder.append_chunk("(", math="{{")
-            for argument, lookahead in iter_lookahead(arguments):
+            builder.append(_ARGUMENTS_OPEN)
+            for index, argument in enumerate(arguments):
+                if index:
+                    builder.append(_COMMA_SPACE)
                 builder.append_term(argument)
-                if lookahead:
-                    builder.append_chunk(", ", math=",\\ ")
-            builder.append_chunk(")", math="}}")
+            builder.append(_ARGUMENTS_CLOSE)
         else:
             error_operator = operator.name or operator.implementation
             raise NotImplementedError(
@@ -240,45 +402,45 @@ def render_function_operator(
 @register_function_operator(terms.replace)
 def render_replace(arguments: terms.Arguments, builder: BoxBuilder) -> None:
     builder.append_term(arguments[0])
-    builder.append_chunk("[", math="\\mxPreApplySkip\\left[")
+    builder.append(_INDEX_OPEN)
     builder.append_term(arguments[1])
-    builder.append_chunk(" ↦ ", math="\\mapsto")
+    builder.append(_MAPSTO)
     builder.append_term(arguments[2])
-    builder.append_chunk("]", math="\\right]")
+    builder.append(_BRACKET_CLOSE)
 
 
 @register_function_operator(booleans.lnot)
 def render_booleans_lnot(arguments: terms.Arguments, builder: BoxBuilder) -> None:
-    builder.append_chunk("¬", math="\\lnot")
+    builder.append(_LNOT)
     builder.append_term(arguments[0])
 
 
 @register_function_operator(mappings.getitem)
 def render_getitem(arguments: terms.Arguments, builder: BoxBuilder) -> None:
     builder.append_term(arguments[0])
-    builder.append_chunk("[", math="\\mxPreApplySkip\\left[")
+    builder.append(_INDEX_OPEN)
     builder.append_term(arguments[1])
-    builder.append_chunk("]", math="\\right]")
+    builder.append(_BRACKET_CLOSE)
     if len(arguments) == 3:
-        builder.append_chunk("?", math="?")
+        builder.append(_DEFAULT)
         builder.append_term(arguments[2])
 
 
 @register_function_operator(mappings.setitem)
 def render_setitem(arguments: terms.Arguments, builder: BoxBuilder) -> None:
     builder.append_term(arguments[0])
-    builder.append_chunk("[", math="\\left[")
+    builder.append(_BRACKET_OPEN)
     builder.append_term(arguments[1])
-    builder.append_chunk(" ↦ ", math="\\mapsto")
+    builder.append(_MAPSTO)
     builder.append_term(arguments[2])
-    builder.append_chunk("]", math="\\right]")
+    builder.append(_BRACKET_CLOSE)
 
 
 @register_function_operator(records.getfield_operator)
 def render_getfield(arguments: terms.Arguments, builder: BoxBuilder) -> None:
     builder.append_term(arguments[0])
     field = arguments[1]
-    builder.append_chunk(".", math=".")
+    builder.append(_DOT)
     if isinstance(field, strings.String):
         builder.append_chunk(field.value, math=f"\\texttt{{{field.value}}}")
     else:
@@ -287,17 +449,17 @@ def render_getfield(arguments: terms.Arguments, builder: BoxBuilder) -> None:
 
 @register_function_operator(records.setfield_operator)
 def render_setfield(arguments: terms.Arguments, builder: BoxBuilder) -> None:
-    builder.append_chunk("(", math="\\left(")
+    builder.append(_PAREN_OPEN)
     builder.append_term(arguments[0])
     field = arguments[1]
-    builder.append_chunk(".", math=".")
+    builder.append(_DOT)
     if isinstance(field, strings.String):
         builder.append_chunk(field.value, math=f"\\texttt{{{field.value}}}")
     else:
         builder.append_term(field)
-    builder.append_chunk(" := ", math=":=")
+    builder.append(_ASSIGN)
     builder.append_term(arguments[2])
-    builder.append_chunk(")", math="\\right)")
+    builder.append(_PAREN_CLOSE)
 
 
 @register_function_operator(tuples.project_operator)
@@ -305,42 +467,42 @@ def render_project(arguments: terms.Arguments, builder: BoxBuilder) -> None:
     index = arguments[1]
     if isinstance(index, numbers.Integer):
         builder.append_chunk(f"#{index.value}")
-        builder.append_chunk("(", math="\\left(")
+        builder.append(_PAREN_OPEN)
         builder.append_term(arguments[0])
-        builder.append_chunk(")", math="\\right)")
+        builder.append(_PAREN_CLOSE)
     else:
         builder.append_term(arguments[0])
-        builder.append_chunk("[", math="\\left[")
+        builder.append(_BRACKET_OPEN)
         builder.append_term(index)
-        builder.append_chunk("]", math="\\right]")
+        builder.append(_BRACKET_CLOSE)
 
 
 @register_function_operator(sets.not_contains)
 def _render_sets_not_contains(arguments: terms.Arguments, builder: BoxBuilder) -> None:
     builder.append_term(arguments[1])
-    builder.append_chunk(" ∉ ", math="\\not\\in")
+    builder.append(_NOT_IN)
     builder.append_term(arguments[0])
 
 
 @register_function_operator(sets.contains)
 def _render_sets_contains(arguments: terms.Arguments, builder: BoxBuilder) -> None:
     builder.append_term(arguments[1])
-    builder.append_chunk(" ∈ ", math="\\in")
+    builder.append(_IN)
     builder.append_term(arguments[0])
 
 
 @register_function_operator(records.construct)
 def _render_records_construct(arguments: terms.Arguments, builder: BoxBuilder) -> None:
-    builder.append_chunk("⟨", math="\\left\\langle")
-    for (field_name, field_value), lookahead in iter_lookahead(
+    builder.append(_ANGLE_OPEN)
+    for index, (field_name, field_value) in enumerate(
         zip(arguments[::2], arguments[1::2])
     ):
+        if index:
+            builder.append(_COMMA)
         builder.append_term(field_name)
-        builder.append_chunk(": ", math=":")
+        builder.append(_COLON)
         builder.append_term(field_value)
-        if lookahead:
-            builder.append_chunk(", ", math=",")
-    builder.append_chunk("⟩", math="\\right\\rangle")
+    builder.append(_ANGLE_CLOSE)
 
 
 def register_binary_infix_operator(
@@ -351,15 +513,17 @@ def register_binary_infix_operator(
     prefix: t.Optional[Chunk] = None,
     suffix: t.Optional[Chunk] = None,
 ) -> None:
+    infix = Chunk(text, math=math)
+
     @register_function_operator(operator)
     def _render_operator(arguments: terms.Arguments, builder: BoxBuilder) -> None:
         if prefix is not None:
-            builder.append_chunk(prefix.text, math=prefix.math)
+            builder.append(prefix)
         builder.append_term(arguments[0])
-        builder.append_chunk(text, math=math)
+        builder.append(infix)
         builder.append_term(arguments[1])
         if suffix is not None:
-            builder.append_chunk(suffix.text, math=suffix.math)
+            builder.append(suffix)
 
 
 register_binary_infix_operator(numbers.add, " + ", math="+")
@@ -381,28 +545,28 @@ register_binary_infix_operator(booleans.lor, " ∨ ", math="\\lor")
 @render_value.register
 def _render_boolean(value: booleans.Boolean, builder: BoxBuilder) -> None:
     if value.value:
-        builder.append_chunk("true", math="\\texttt{true}")
+        builder.append(_TRUE)
     else:
-        builder.append_chunk("false", math="\\texttt{false}")
+        builder.append(_FALSE)
 
 
 @render_value.register
 def _render_mapping(value: mappings.Mapping, builder: BoxBuilder) -> None:
-    builder.append_chunk("{", math="\\left\\{")
-    for (key, term), lookahead in iter_lookahead(value.entries.items()):
+    builder.append(_BRACE_OPEN)
+    for index, (key, term) in enumerate(value.entries.items()):
+        if index:
+            builder.append(_COMMA)
         builder.append_term(key)
-        builder.append_chunk(" ↦ ", math="\\mapsto")
+        builder.append(_MAPSTO)
         builder.append_term(term)
-        if lookahead:
-            builder.append_chunk(", ", math=",")
-    builder.append_chunk("}", math="\\right\\}")
+    builder.append(_BRACE_CLOSE)
 
 
 @render_value.register
 def _render_heap(value: references.Heap, builder: BoxBuilder) -> None:
-    builder.append_chunk("{", math="\\left\\{")
-    builder.append_chunk("HEAP")
-    builder.append_chunk("}", math="\\right\\}")
+    builder.append(_BRACE_OPEN)
+    builder.append(_HEAP)
+    builder.append(_BRACE_CLOSE)
 
 
 @render_value.register
@@ -412,7 +576,7 @@ def _render_number(value: numbers.Number, builder: BoxBuilder) -> None:
 
 @render_value.register
 def _render_null(value: null.Null, builder: BoxBuilder) -> None:
-    builder.append_chunk("⊥", math="\\bot")
+    builder.append(_BOTTOM)
 
 
 @render_value.register
@@ -424,34 +588,34 @@ def _render_string(value: strings.String, builder: BoxBuilder) -> None:
 
 @render_value.register
 def _render_record(value: records.Record, builder: BoxBuilder) -> None:
-    builder.append_chunk("⟨", math="\\left\\langle")
-    for (field_name, field_value), lookahead in iter_lookahead(value.fields.items()):
+    builder.append(_ANGLE_OPEN)
+    for index, (field_name, field_value) in enumerate(value.fields.items()):
+        if index:
+            builder.append(_COMMA)
         builder.append_chunk(field_name)
-        builder.append_chunk(": ", math=":")
+        builder.append(_COLON)
         builder.append_term(field_value)
-        if lookahead:
-            builder.append_chunk(", ", math=",")
-    builder.append_chunk("⟩", math="\\right\\rangle")
+    builder.append(_ANGLE_CLOSE)
 
 
 @render_value.register
 def _render_tuple(value: tuples.Tuple, builder: BoxBuilder) -> None:
-    builder.append_chunk("⟨", math="\\left[\\,")
-    for component, lookahead in iter_lookahead(value.components):
+    builder.append(_TUPLE_OPEN)
+    for index, component in enumerate(value.components):
+        if index:
+            builder.append(_COMMA)
         builder.append_term(component)
-        if lookahead:
-            builder.append_chunk(", ", math=",")
-    builder.append_chunk("⟩", math="\\,\\right]")
+    builder.append(_TUPLE_CLOSE)
 
 
 @render_value.register
 def _render_set(value: sets.Set, builder: BoxBuilder) -> None:
-    builder.append_chunk("{", math="\\left\\{")
-    for member, lookahead in iter_lookahead(value.members):
+    builder.append(_BRACE_OPEN)
+    for index, member in enumerate(value.members):
+        if index:
+            builder.append(_COMMA_SPACE)
         builder.append_term(member)
-        if lookahead:
-            builder.append_chunk(", ", math=",\\ ")
-    builder.append_chunk("}", math="\\right\\}")
+    builder.append(_BRACE_CLOSE)
 
 
 @render_value.register
@@ -4,6 +4,10 @@
 
 from __future__ import annotations
 
+import typing as t
+
+import functools
+
 from ...core import terms
 from ...data import numbers
 from ...utils import parser
@@ -60,18 +64,30 @@ def _parse_atom(stream: parser.TokenStream[TokenType]) -> terms.Term:
     raise ExpressionSyntaxError(f"expected arithmetic expression but found {token}")
 
 
-def _parse_binary(
-    stream: parser.TokenStream[TokenType], min_precedence: int = -1
-) -> terms.Term:
-    left = _parse_atom(stream)
-    while stream.token and stream.token.typ in _PRECEDENCE:
-        if _PRECEDENCE[stream.token.typ] < min_precedence:
-            return left
-        operator = stream.consume()
-        right = _parse_binary(stream, _PRECEDENCE[operator.typ] + 1)
-        left = semantics.binary_expr(left, _OPERATORS[operator.typ], right)
-    return left
+def _reduce(
+    operands: t.List[terms.Term], operators: t.List[t.Tuple[terms.Term, int]]
+) -> None:
+    right = operands.pop()
+    operator, _ = operators.pop()
+    operands[-1] = semantics.binary_expr(operands[-1], operator, right)
+
+
+def _parse_binary(stream: parser.TokenStream[TokenType]) -> terms.Term:
+    operands = [_parse_atom(stream)]
+    operators: t.List[t.Tuple[terms.Term, int]] = []
+    while (token := stream.token) is not None and token.typ in _PRECEDENCE:
+        precedence = _PRECEDENCE[token.typ]
+        # All operators are left-associative.
+        while operators and operators[-1][1] >= precedence:
+            _reduce(operands, operators)
+        stream.consume()
+        operators.append((_OPERATORS[token.typ], precedence))
+        operands.append(_parse_atom(stream))
+    while operators:
+        _reduce(operands, operators)
+    return operands[0]
 
 
+@functools.lru_cache(maxsize=256)
 def parse_expression(code: str) -> terms.Term:
     return _parse_binary(tokenizer.create_stream(code))
@@ -39,7 +39,7 @@ some_operator = define.variable("operator", text="○", math="\\circ")
 def binary_expr(
     left: terms.Term, operator: terms.Term, right: terms.Term
 ) -> terms.Term:
-    return terms.sequence(left, operator, right)
+    return terms.Sequence.create((left, operator, right))
 
 
 l_eval_rule = define.rule(
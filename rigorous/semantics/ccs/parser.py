@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import typing as t
 
+import functools
+
 from ...core import terms
 from ...data import sets
 from ...utils import parser
@@ -50,6 +52,13 @@ _BINARY_OPERATORS = {
     TokenType.RESTRICT: 6,
 }
 
+_BinaryConstructor = t.Callable[[terms.Term, terms.Term], terms.Term]
+
+_BINARY_CONSTRUCTORS: t.Mapping[TokenType, _BinaryConstructor] = {
+    TokenType.CHOICE: semantics.choice,
+    TokenType.PARALLEL: semantics.parallel,
+}
+
 
 def _parse_action(stream: parser.TokenStream[TokenType]) -> terms.Term:
     token = stream.token
@@ -67,54 +76,76 @@ def _parse_action(stream: parser.TokenStream[TokenType]) -> terms.Term:
 
 
 def _parse_atom(stream: parser.TokenStream[TokenType]) -> terms.Term:
-    token = stream.token
-    if token is None:
-        raise CCSSyntaxError("expected process term but found EOF")
-    if stream.accept(TokenType.NULL):
-        return semantics.DEAD_PROCESS
-    elif stream.accept(TokenType.LEFT_PAR):
-        process = _parse_binary(stream)
-        stream.expect(TokenType.RIGHT_PAR)
-        return process
-    elif stream.accept(TokenType.VARIABLE):
-        return semantics.ProcessVariable(token.text)
-    elif stream.accept(TokenType.FIX):
-        variable = semantics.ProcessVariable(stream.expect(TokenType.VARIABLE).text)
-        stream.expect(TokenType.EQUALS)
-        return semantics.fix(variable, _parse_binary(stream))
-    action = _parse_action(stream)
-    stream.expect(TokenType.DOT)
-    return semantics.prefix(action, _parse_atom(stream))
-
-
-def _parse_binary(
-    stream: parser.TokenStream[TokenType], min_precedence: int = -1
-) -> terms.Term:
-    left = _parse_atom(stream)
-    while stream.token and stream.token.typ in _BINARY_OPERATORS:
-        if _BINARY_OPERATORS[stream.token.typ] < min_precedence:
-            return left
-        operator = stream.consume()
-        if operator.typ is TokenType.RESTRICT:
-            stream.expect(TokenType.LEFT_BRACE)
-            action_set: t.Set[terms.Term] = set()
-            while not stream.accept(TokenType.RIGHT_BRACE):
-                action_set.add(_parse_action(stream))
-                if stream.accept(TokenType.COMMA):
-                    continue
-                else:
-                    stream.expect(TokenType.RIGHT_BRACE)
-                    break
-            left = semantics.restrict(left, sets.create(action_set))
+    actions: t.List[terms.Term] = []
+    process: terms.Term
+    while True:
+        token = stream.token
+        if token is None:
+            raise CCSSyntaxError("expected process term but found EOF")
+        if stream.accept(TokenType.NULL):
+            process = semantics.DEAD_PROCESS
+        elif stream.accept(TokenType.LEFT_PAR):
+            process = _parse_binary(stream)
+            stream.expect(TokenType.RIGHT_PAR)
+        elif stream.accept(TokenType.VARIABLE):
+            process = semantics.ProcessVariable(token.text)
+        elif stream.accept(TokenType.FIX):
+            variable = semantics.ProcessVariable(stream.expect(TokenType.VARIABLE).text)
+            stream.expect(TokenType.EQUALS)
+            process = semantics.fix(variable, _parse_binary(stream))
+        else:
+            actions.append(_parse_action(stream))
+            stream.expect(TokenType.DOT)
+            continue
+        break
+    # Prefixes bind to the right, `a!.b!.0` is `a!.(b!.0)`.
+    for action in reversed(actions):
+        process = semantics.prefix(action, process)
+    return process
+
+
+def _parse_restrict(stream: parser.TokenStream[TokenType]) -> terms.Term:
+    stream.expect(TokenType.LEFT_BRACE)
+    action_set: t.Set[terms.Term] = set()
+    while not stream.accept(TokenType.RIGHT_BRACE):
+        action_set.add(_parse_action(stream))
+        if stream.accept(TokenType.COMMA):
+            continue
+        else:
+            stream.expect(TokenType.RIGHT_BRACE)
+            break
+    return sets.create(action_set)
+
+
+def _reduce(
+    operands: t.List[terms.Term], operators: t.List[t.Tuple[_BinaryConstructor, int]]
+) -> None:
+    right = operands.pop()
+    constructor, _ = operators.pop()
+    operands[-1] = constructor(operands[-1], right)
+
+
+def _parse_binary(stream: parser.TokenStream[TokenType]) -> terms.Term:
+    operands = [_parse_atom(stream)]
+    operators: t.List[t.Tuple[_BinaryConstructor, int]] = []
+    while (token := stream.token) is not None and token.typ in _BINARY_OPERATORS:
+        precedence = _BINARY_OPERATORS[token.typ]
+        while operators and operators[-1][1] >= precedence:
+            _reduce(operands, operators)
+        stream.consume()
+        constructor = _BINARY_CONSTRUCTORS.get(token.typ)
+        if constructor is None:
+            # Restrictions are postfix and apply to everything binding tighter.
+            operands[-1] = semantics.restrict(operands[-1], _parse_restrict(stream))
         else:
-            right = _parse_binary(stream, _BINARY_OPERATORS[operator.typ] + 1)
-            if operator.typ is TokenType.CHOICE:
-                left = semantics.choice(left, right)
-            else:
-                left = semantics.parallel(left, right)
-    return left
+            operators.append((constructor, precedence))
+            operands.append(_parse_atom(stream))
+    while operators:
+        _reduce(operands, operators)
+    return operands[0]
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_ccs(process: str) -> terms.Term:
     stream = tokenizer.create_stream(process)
     term = _parse_binary(stream)
@@ -18,6 +18,8 @@ from ...semantics import sos
 # Let's introduce process variables and actions as a new data type.
 @d.dataclass(frozen=True)
 class ProcessVariable(terms.Value):
+    __slots__ = ("identifier",)
+
     identifier: str
 
 
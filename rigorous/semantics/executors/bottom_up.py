@@ -11,7 +11,7 @@ from __future__ import annotations
 import dataclasses as d
 import typing as t
 
-import collections
+import functools
 import itertools
 
 from ...core import terms, inference, unification
@@ -63,6 +63,59 @@ class TransitionRule:
     premises: t.Tuple[TransitionTerm, ...]
     variables: t.FrozenSet[terms.Variable]
 
+    # The length of the source if it is a sequence and its atomic elements by
+    # index, a state which is a sequence has to agree with them to match.
+    length: t.Optional[int]
+    guards: t.Tuple[t.Tuple[int, terms.Term], ...]
+
+    def may_match(self, state: terms.Sequence) -> bool:
+        elements = state.elements
+        for index, guard in self.guards:
+            element = elements[index]
+            if element is not guard and element.is_value and element != guard:
+                return False
+        return True
+
+
+# Rules are immutable, hence, their decomposition is shared by all executors.
+@functools.lru_cache(maxsize=None)
+def _decompose_rule(rule: inference.Rule) -> TransitionRule:
+    conclusion = decompose_transition(rule.conclusion)
+    assert conclusion, "conclusion must be an SOS transition"
+    premises: t.List[TransitionTerm] = []
+    bound: t.Set[terms.Variable] = set(conclusion.source.variables)
+    for premise in rule.premises:
+        transition = decompose_transition(premise)
+        assert transition, "premises must be SOS transitions"
+        # This criterion is necessary but insufficient for the optimizations to
+        # work properly. Unfortunately there is no sufficient “local” criterion
+        # only considering a single rule. The algorithm will later fail if it
+        # finds out that the rules do not satisfy all necessary conditions.
+        assert (
+            transition.source.variables <= bound
+        ), f"transition contains unbound variables {transition.source.variables - bound}"
+        bound |= transition.action.variables
+        bound |= transition.target.variables
+        premises.append(transition)
+    source = conclusion.source
+    length: t.Optional[int] = None
+    guards: t.Tuple[t.Tuple[int, terms.Term], ...] = ()
+    if isinstance(source, terms.Sequence):
+        length = source.length
+        guards = tuple(
+            (index, element)
+            for index, element in enumerate(source.elements)
+            if isinstance(element, (terms.Symbol, terms.Value))
+        )
+    return TransitionRule(
+        original=rule,
+        conclusion=conclusion,
+        premises=tuple(premises),
+        variables=frozenset(rule.variables - source.variables),
+        length=length,
+        guards=guards,
+    )
+
 
 Renaming = t.Mapping[terms.Variable, terms.Variable]
 
@@ -74,12 +127,16 @@ class _DeferredCondition:
     solution: terms.Substitution
 
     def get_environment(self, substitution: terms.Substitution) -> terms.Substitution:
-        environment = {
-            variable: substitution[renamed]
-            for variable, renamed in self.renaming.items()
-            if renamed in substitution
-        }
-        environment.update(self.solution)
+        # The renamed variables do not occur in the source of the rule, hence, the
+        # bindings taken from `substitution` never clash with the `solution`.
+        if not self.renaming:
+            return self.solution
+        environment = dict(self.solution)
+        for variable, renamed in self.renaming.items():
+            try:
+                environment[variable] = substitution[renamed]
+            except KeyError:
+                pass
         return environment
 
     def get_verdict(self, substitution: terms.Substitution) -> inference.Verdict:
@@ -120,32 +177,27 @@ class Executor(interface.Executor[Transition]):
 
     transition_rules: t.List[TransitionRule] = d.field(default_factory=list)
 
+    _rules_by_length: t.Dict[int, t.Tuple[TransitionRule, ...]] = d.field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def add_rule(self, rule: inference.Rule) -> None:
-        conclusion = decompose_transition(rule.conclusion)
-        assert conclusion, "conclusion must be an SOS transition"
-        premises: t.List[TransitionTerm] = []
-        bound: t.Set[terms.Variable] = set(conclusion.source.variables)
-        for premise in rule.premises:
-            transition = decompose_transition(premise)
-            assert transition, "premises must be SOS transitions"
-            # This criterion is necessary but insufficient for the optimizations to
-            # work properly. Unfortunately there is no sufficient “local” criterion
-            # only considering a single rule. The algorithm will later fail if it
-            # finds out that the rules do not satisfy all necessary conditions.
-            assert (
-                transition.source.variables <= bound
-            ), f"transition contains unbound variables {transition.source.variables - bound}"
-            bound |= transition.action.variables
-            bound |= transition.target.variables
-            premises.append(transition)
-        self.transition_rules.append(
-            TransitionRule(
-                original=rule,
-                conclusion=conclusion,
-                premises=tuple(premises),
-                variables=frozenset(rule.variables - conclusion.source.variables),
+        self.transition_rules.append(_decompose_rule(rule))
+        self._rules_by_length.clear()
+
+    def _get_candidate_rules(self, state: terms.Term) -> t.Iterable[TransitionRule]:
+        if not isinstance(state, terms.Sequence):
+            return self.transition_rules
+        length = state.length
+        try:
+            rules = self._rules_by_length[length]
+        except KeyError:
+            rules = self._rules_by_length[length] = tuple(
+                rule
+                for rule in self.transition_rules
+                if rule.length is None or rule.length == length
             )
-        )
+        return [rule for rule in rules if rule.length is None or rule.may_match(state)]
 
     def _apply_rule(
         self,
@@ -157,18 +209,26 @@ class Executor(interface.Executor[Transition]):
         if substitution is None:
             return
 
-        renaming = {variable: variable.clone() for variable in rule.variables}
-
-        conditions: t.List[_DeferredCondition] = []
+        satisfiable: t.List[inference.Condition] = []
         for condition in rule.original.conditions:
             verdict = condition.get_verdict(substitution)
             if verdict is inference.Verdict.VIOLATED:
                 return
             elif verdict is inference.Verdict.SATISFIABLE:
-                conditions.append(_DeferredCondition(condition, renaming, substitution))
+                satisfiable.append(condition)
+
+        # The fresh variables escape into the cached destinations, hence, they
+        # cannot be reused and are only created once the conditions allow it.
+        renaming = {variable: variable.clone() for variable in rule.variables}
+
+        conditions = [
+            _DeferredCondition(condition, renaming, substitution)
+            for condition in satisfiable
+        ]
 
         substitution = dict(substitution)
         substitution.update(renaming)
+        mask = rule.original.variables_mask
 
         solver = unification.Solver()
         for (left, right) in rule.original.constraints:
@@ -199,24 +259,39 @@ class Executor(interface.Executor[Transition]):
             handle = pending.pop()
             raw_premise, *remaining = handle.premises
             solution = handle.solver.solution
+            # All variables of the premise are bound by `substitution`, hence,
+            # applying the solution to its bindings first allows substituting the
+            # premise in a single pass instead of two.
+            solution_mask = terms.get_substitution_mask(solution)
+            solution_memo: terms.SubstitutionMemo = {}
+            combined = {
+                variable: term.substitute_memoized(solution, solution_mask, solution_memo)
+                for variable, term in substitution.items()
+            }
+            combined_memo: terms.SubstitutionMemo = {}
             premise = TransitionTerm(
-                source=raw_premise.source.substitute(substitution).substitute(solution),
-                action=raw_premise.action.substitute(substitution).substitute(solution),
-                target=raw_premise.target.substitute(substitution).substitute(solution),
+                source=raw_premise.source.substitute_memoized(
+                    combined, mask, combined_memo
+                ),
+                action=raw_premise.action.substitute_memoized(
+                    combined, mask, combined_memo
+                ),
+                target=raw_premise.target.substitute_memoized(
+                    combined, mask, combined_memo
+                ),
             )
 
             for destination in self._explore(premise.source, cache):
-                solver = handle.solver.clone()
-                solver.merge(destination.solver)
-
-                if solver.has_no_solutions:
-                    continue
-
-                solver.add_equation((premise.action, destination.action))
-                solver.add_equation((premise.target, destination.target))
-
-                if solver.has_no_solutions:
+                forked = handle.solver.fork_with(
+                    destination.solver,
+                    (
+                        (premise.action, destination.action),
+                        (premise.target, destination.target),
+                    ),
+                )
+                if forked is None:
                     continue
+                solver = forked
 
                 solution = solver.solution
 
@@ -255,19 +330,14 @@ class Executor(interface.Executor[Transition]):
     def _one_step(
         self, state: terms.Term, cache: t.Dict[terms.Term, t.Sequence[_Destination]],
     ) -> t.Iterable[_Destination]:
-        assert not state.variables, "state must not contain any variables"
+        assert not state.variables_mask, "state must not contain any variables"
         try:
             return cache[state]
         except KeyError:
             pass
-        destinations = tuple(
-            itertools.chain(
-                *(
-                    self._apply_rule(state, rule, cache)
-                    for rule in self.transition_rules
-                )
-            )
-        )
+        destinations: t.List[_Destination] = []
+        for rule in self._get_candidate_rules(state):
+            destinations.extend(self._apply_rule(state, rule, cache))
         cache[state] = destinations
         return destinations
 
@@ -278,14 +348,28 @@ class Executor(interface.Executor[Transition]):
 
         if self.shortcircuit:
             final_destinations: t.List[_Destination] = []
-            pending_destinations = collections.deque(destinations)
+            # States on the current chain of internal transitions. A target which
+            # is still on the chain closes a cycle and is not unrolled again.
+            # Targets are pushed as markers below their destinations and leave
+            # the chain once all of them have been processed.
+            discovered: t.Set[terms.Term] = {state}
+            pending_destinations: t.List[t.Union[_Destination, terms.Term]] = list(
+                destinations
+            )
             while pending_destinations:
                 destination = pending_destinations.pop()
-                if destination.action != sos.ACTION_TAU or destination.target.variables:
+                if not isinstance(destination, _Destination):
+                    discovered.discard(destination)
+                elif destination.action != sos.ACTION_TAU or destination.target.variables_mask:
+                    final_destinations.append(destination)
+                elif destination.target in discovered:
                     final_destinations.append(destination)
                 else:
+                    target = destination.target
+                    discovered.add(target)
+                    pending_destinations.append(target)
                     has_inner = False
-                    for inner_destination in self._one_step(destination.target, cache):
+                    for inner_destination in self._one_step(target, cache):
                         pending_destinations.append(
                             _Destination(
                                 action=inner_destination.action,
@@ -307,7 +391,7 @@ class Executor(interface.Executor[Transition]):
         return destinations
 
     def iter_transitions(self, initial_state: terms.Term) -> t.Iterator[Transition]:
-        pending: t.Deque[terms.Term] = collections.deque([initial_state])
+        pending: t.List[terms.Term] = [initial_state]
         while pending:
             state = pending.pop()
             counter = 0
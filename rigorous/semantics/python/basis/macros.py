@@ -40,6 +40,10 @@ def get_macro(name: str) -> Macro:
     return _macros[name]
 
 
+def find_macro(name: str) -> t.Optional[Macro]:
+    return _macros.get(name)
+
+
 def get_macros() -> t.Mapping[str, Macro]:
     return _macros
 
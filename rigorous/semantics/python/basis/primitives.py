@@ -383,6 +383,10 @@ def primitive_sequence_concat(
     """
     Concatenates both vectors.
     """
+    if not other.components:
+        return sequence
+    elif not sequence.components:
+        return other
     return tuples.Tuple(sequence.components + other.components)
 
 
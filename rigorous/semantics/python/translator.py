@@ -285,8 +285,9 @@ class Translator:
             identifier = ast.function.identifier
             mechanism = self.block_stack.head.get_mechanism(identifier)
             if self.mode is Mode.PRIMITIVE and mechanism is not blocks.Mechanism.LOCAL:
-                if basis.macros.is_macro(identifier):
-                    return basis.macros.get_macro(identifier)(
+                macro = basis.macros.find_macro(identifier)
+                if macro is not None:
+                    return macro(
                         self,
                         *(
                             argument.value
@@ -84,7 +84,7 @@ def create_renderer(
     return renderer
 
 
-@latex.latexify_special.register
+@latex.register_latexify_special(TransitionElement)
 def _latexify_transition(special: TransitionElement) -> str:
     parts: t.List[str] = []
     if special.environment is not None:
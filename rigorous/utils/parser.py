@@ -27,20 +27,25 @@ class Tokenizer(t.Generic[TokenType]):
     token_enum: t.Type[TokenType]
 
     _tokenize_regex: re.Pattern[str]
+    _token_types: t.Dict[str, TokenType]
 
     def __init__(self, token_enum: t.Type[TokenType]) -> None:
         self.token_enum = token_enum
         self._tokenize_regex = re.compile(
             "|".join(fr"(?P<{typ.name}>{typ.regex})" for typ in self.token_enum)
         )
+        self._token_types = {typ.name: typ for typ in self.token_enum}
 
     def tokenize(self, code: str) -> t.Iterator[Token[TokenType]]:
+        token_types = self._token_types
         for match in self._tokenize_regex.finditer(code):
             assert isinstance(match.lastgroup, str)
-            yield Token(self.token_enum[match.lastgroup], match, match.group(0))
+            yield Token(token_types[match.lastgroup], match, match.group(0))
 
     def create_stream(self, code: str) -> TokenStream[TokenType]:
-        return TokenStream(list(self.tokenize(code)))
+        return TokenStream(
+            [token for token in self.tokenize(code) if not token.typ.ignore]
+        )
 
 
 @d.dataclass(frozen=True)
@@ -56,16 +61,10 @@ class UnexpectedTokenError(Exception):
 
 @d.dataclass(eq=False)
 class TokenStream(t.Generic[TokenType]):
+    # The tokens must not contain ignored tokens, see `Tokenizer.create_stream`.
     tokens: t.Sequence[Token[TokenType]]
     position: int = 0
 
-    def __post_init__(self) -> None:
-        self._skip_ignore()
-
-    def _skip_ignore(self) -> None:
-        while self.token and self.token.typ.ignore:
-            self.position += 1
-
     @property
     def token(self) -> t.Optional[Token[TokenType]]:
         try:
@@ -76,7 +75,6 @@ class TokenStream(t.Generic[TokenType]):
     def consume(self) -> Token[TokenType]:
         token = self.tokens[self.position]
         self.position += 1
-        self._skip_ignore()
         return token
 
     def expect(self, typ: TokenType) -> Token[TokenType]:
@@ -57,6 +57,11 @@ _THROW_PATTERN = actions.create_throw(_THROW_EXCEPTION)
 
 
 def unwrap_throw(action: terms.Term) -> t.Optional[terms.Term]:
+    # Most actions are τ, reject everything not shaped like a throw upfront.
+    if not isinstance(action, terms.Sequence) or len(action.elements) != 2:
+        return None
+    if action.elements[0] is not actions.ACTION_THROW:
+        return None
     match = unification.match(_THROW_PATTERN, action)
     if match:
         return match[_THROW_EXCEPTION]
@@ -64,26 +69,25 @@ def unwrap_throw(action: terms.Term) -> t.Optional[terms.Term]:
         return None
 
 
+_VAR_MEMORY = terms.variable("memory")
+_VAR_INNER = terms.variable("inner")
+
+_DONE_PATTERN = memory.create_memory_layer(
+    _VAR_MEMORY, stack.create_stack_layer(stack.STACK_NIL)
+)
+_MEMORY_PATTERN = memory.create_memory_layer(_VAR_MEMORY, _VAR_INNER)
+
+
 def is_done_state(state: terms.Term) -> bool:
-    var_memory = terms.variable("memory")
-    return bool(
-        unification.match(
-            memory.create_memory_layer(
-                var_memory, stack.create_stack_layer(stack.STACK_NIL),
-            ),
-            state,
-        )
-    )
+    return bool(unification.match(_DONE_PATTERN, state))
 
 
 def unwrap_memory(state: terms.Term) -> t.Tuple[mappings.Mapping, terms.Term]:
-    var_memory = terms.variable("memory")
-    var_inner = terms.variable("inner")
-    match = unification.match(memory.create_memory_layer(var_memory, var_inner), state)
+    match = unification.match(_MEMORY_PATTERN, state)
     assert match
-    x = match[var_memory]
+    x = match[_VAR_MEMORY]
     assert isinstance(x, mappings.Mapping)
-    return x, match[var_inner]
+    return x, match[_VAR_INNER]
 
 
 def run_test(test: programs.TestCase) -> Result:
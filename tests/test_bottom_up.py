@@ -0,0 +1,25 @@
+# -*- coding:utf-8 -*-
+#
+# Copyright (C) 2020, Maximilian Köhl <mail@koehlma.de>
+
+from __future__ import annotations
+
+import itertools
+
+from rigorous.core import inference, terms
+from rigorous.semantics import sos
+from rigorous.semantics.executors import bottom_up
+
+
+def test_internal_cycle() -> None:
+    a, b, c = terms.symbol("a"), terms.symbol("b"), terms.symbol("c")
+    executor = bottom_up.Executor()
+    executor.add_rule(inference.Rule(sos.transition(a, sos.ACTION_TAU, b)))
+    executor.add_rule(inference.Rule(sos.transition(b, sos.ACTION_TAU, a)))
+    executor.add_rule(inference.Rule(sos.transition(c, sos.ACTION_TAU, c)))
+    transitions = list(itertools.islice(executor.iter_transitions(a), 2))
+    assert [transition.target for transition in transitions] == [a, a]
+    assert transitions[0].internal_transitions == 2
+    transition = next(executor.iter_transitions(c))
+    assert transition.target == c
+    assert transition.internal_transitions == 1
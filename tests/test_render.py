@@ -0,0 +1,48 @@
+# -*- coding:utf-8 -*-
+#
+# Copyright (C) 2020, Maximilian Köhl <mail@koehlma.de>
+
+from __future__ import annotations
+
+import dataclasses as d
+
+from rigorous.core import terms
+from rigorous.data import numbers
+from rigorous.pretty import console, render
+
+
+@d.dataclass(frozen=True)
+class _Answer(numbers.Integer):
+    __slots__ = ()
+
+
+class _Three(render.Special):
+    __slots__ = ()
+
+
+def _render_three(*boxes: render.Box) -> render.Special:
+    return _Three()
+
+
+def test_late_value_renderer() -> None:
+    answer = _Answer(42)
+    assert console.format_term(answer, render.Renderer(), colorize=False) == "42"
+
+    @render.render_value.register
+    def _render_answer(value: _Answer, builder: render.BoxBuilder) -> None:
+        builder.append_chunk("answer")
+
+    assert console.format_term(answer, render.Renderer(), colorize=False) == "answer"
+
+
+def test_equal_values_render_differently() -> None:
+    renderer = render.Renderer()
+    assert console.format_term(numbers.Float(0.0), renderer, colorize=False) == "0.0"
+    assert console.format_term(numbers.Float(-0.0), renderer, colorize=False) == "-0.0"
+
+
+def test_special_pattern_of_evaluated_term() -> None:
+    renderer = render.Renderer()
+    renderer.add_pattern(render.SpecialPattern(numbers.create(3), (), _render_three))
+    term = terms.Apply.create(numbers.add, (numbers.create(1), numbers.create(2)))
+    assert isinstance(renderer.render_term(term).special, _Three)
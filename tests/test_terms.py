@@ -0,0 +1,57 @@
+# -*- coding:utf-8 -*-
+#
+# Copyright (C) 2020, Maximilian Köhl <mail@koehlma.de>
+
+from __future__ import annotations
+
+from rigorous.core import terms
+from rigorous.data import mappings, numbers, strings
+
+
+def test_iter_preorder() -> None:
+    x, y = terms.variables("x", "y")
+    inner = terms.sequence(x, "b")
+    addition = numbers.add(y, numbers.create(1))
+    term = terms.sequence("a", inner, addition)
+    assert list(term.iter_preorder()) == [
+        term,
+        terms.symbol("a"),
+        inner,
+        x,
+        terms.symbol("b"),
+        addition,
+        y,
+        numbers.create(1),
+    ]
+    assert list(term.iter_subterms(skip_operator_arguments=True)) == [
+        term,
+        terms.symbol("a"),
+        inner,
+        x,
+        terms.symbol("b"),
+        addition,
+    ]
+
+
+def test_function_operator() -> None:
+    assert numbers.add.apply((numbers.create(1), numbers.create(2))) == numbers.create(3)
+    assert numbers.add.apply((numbers.create(1), terms.symbol("a"))) is None
+    assert numbers.add.apply((numbers.create(1),)) is None
+    assert numbers.neg.apply((numbers.create(1),)) == numbers.create(-1)
+
+
+def test_function_operator_optional() -> None:
+    key = strings.create("key")
+    mapping = mappings.create({key: numbers.create(1)})
+    missing = strings.create("missing")
+    assert mappings.getitem.apply((mapping, key)) == numbers.create(1)
+    assert mappings.getitem.apply((mapping, missing)) is None
+    assert mappings.getitem.apply((mapping, missing, key)) == key
+    assert mappings.getitem.apply((mapping,)) is None
+    assert mappings.getitem.apply((key, key)) is None
+
+
+def test_shift() -> None:
+    one, three = numbers.create(1), numbers.create(3)
+    assert numbers.shift_left.apply((one, three)) == numbers.create(8)
+    assert numbers.shift_right.apply((numbers.create(8), three)) == one
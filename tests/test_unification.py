@@ -18,3 +18,29 @@ def test_addition() -> None:
     solver.add_equation((y, numbers.create(4)))
     assert solver.is_solved
     assert not solver.has_no_solutions
+
+
+def test_clone() -> None:
+    x, y = terms.variables("x", "y")
+    solver = unification.Solver()
+    solver.add_equation((x, numbers.add(y, numbers.create(1))))
+    solution = solver.solution
+    clone = solver.clone()
+    clone.add_equation((y, numbers.create(2)))
+    assert clone.solution[x] == numbers.create(3)
+    assert solver.solution[x] == numbers.add(y, numbers.create(1))
+    assert y not in solution
+
+
+def test_fork_with() -> None:
+    x, y = terms.variables("x", "y")
+    solver = unification.Solver()
+    solver.add_equation((x, numbers.create(1)))
+    other = unification.Solver()
+    other.add_equation((y, numbers.create(2)))
+    fork = solver.fork_with(other, [(numbers.add(x, y), numbers.create(3))])
+    assert fork is not None
+    assert fork.is_solved
+    assert fork.solution == {x: numbers.create(1), y: numbers.create(2)}
+    assert y not in solver.solution
+    assert solver.fork_with(other, [(x, y)]) is None